@@ -12,6 +12,9 @@ After all rounds the Director is prompted to produce the final polished script.
 """
 
 import os
+import queue
+import threading
+import time
 from typing import Generator, List, Dict
 
 import anthropic
@@ -26,17 +29,84 @@ load_dotenv()
 # Model to use for both agents
 MODEL = "claude-sonnet-4-6"
 
+# Cheaper model used only to compact old discussion rounds into a summary.
+COMPACT_MODEL = "claude-haiku-4-5"
+
+# When an agent's accumulated history exceeds this many characters, older
+# rounds are collapsed into a summary so per-round input tokens stay bounded
+# instead of growing linearly with the round number.
+COMPACT_THRESHOLD_CHARS = 60_000
+COMPACT_MAX_TOKENS = 2000
+
 # Token budgets — kept as named constants so they're easy to tune.
 # Discussion rounds: enough for a solid draft or critique without being excessive.
 # Final script: maximum the model supports per single API call.
 MAX_TOKENS_ROUND = 64000
 MAX_TOKENS_FINAL = 64000   # hard ceiling for claude-sonnet-4-6
 
+# The final script starts with a modest budget and only expands to
+# MAX_TOKENS_FINAL once the model demonstrably needs more.  Most plays finish
+# well under the ceiling, and every continuation replays the accumulated
+# script as context — so over-asking up front is pure waste.
+MAX_TOKENS_FINAL_INITIAL = 16000
+
+# How often run_batch polls the Message Batches API for completion.
+BATCH_POLL_SECONDS = 10.0
+
+# Streamed text is coalesced into chunk events of up to this many characters
+# (flushed at least every _FLUSH_SECONDS).  One event per API token would mean
+# tens of thousands of dict allocations and UI repaints per round; batching
+# keeps perceived latency while cutting that overhead by an order of magnitude.
+_FLUSH_CHARS = 256
+_FLUSH_SECONDS = 0.05
+
 # How many continuation calls we allow when the final script hits the token ceiling.
 # Each continuation picks up exactly where the previous response ended.
 # Set to 0 to disable continuation (not recommended).
 MAX_CONTINUATIONS = 4
 
+# Absolute ceiling on total output tokens across the initial call plus all
+# continuation calls.
+FINAL_OUTPUT_HARD_CAP = MAX_TOKENS_FINAL * (MAX_CONTINUATIONS + 1)
+
+# Sentinel the Director may append in the last round when its response already
+# contains the complete, performance-ready script.  Seeing it lets us skip the
+# separate final-synthesis call — one fewer full-size round trip per session.
+FINAL_READY_MARKER = "<<<FINAL_SCRIPT_READY>>>"
+
+# One Anthropic client per process.  Each construction builds a new httpx
+# client, TLS context, and connection pool; sharing one keeps connections
+# warm across sessions instead of paying a handshake per generation.
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client() -> anthropic.Anthropic:
+    """Return the lazily-initialised module-wide Anthropic client."""
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = anthropic.Anthropic(api_key=os.environ["ANTHROPIC_API_KEY"])
+    return _CLIENT
+
+
+def _cached_message(message: Dict) -> Dict:
+    """
+    Return a copy of *message* whose content carries a `cache_control` breakpoint.
+
+    Anthropic allows up to 4 ephemeral breakpoints per request; we spend one on
+    the system prompt and one on the end of the stable history prefix so the
+    whole prefix is served from the prompt cache on subsequent calls.
+    """
+    content = message["content"]
+    if isinstance(content, str):
+        content = [{"type": "text", "text": content}]
+    else:
+        content = [dict(block) for block in content]
+    content[-1] = {**content[-1], "cache_control": {"type": "ephemeral"}}
+    return {**message, "content": content}
+
 
 class PlayWritingSession:
     """
@@ -51,14 +121,33 @@ class PlayWritingSession:
     """
 
     def __init__(self, genre: str, theme: str, tone: str, max_rounds: int = 5,
-                 language: str = "English"):
-        self.client = anthropic.Anthropic(api_key=os.environ["ANTHROPIC_API_KEY"])
+                 language: str = "English", client: anthropic.Anthropic = None):
+        # Accept an injected client for testing; default to the shared
+        # process-wide client so repeated sessions reuse its connection pool.
+        self.client = client if client is not None else _get_client()
         self.play = PlaySession(genre=genre, theme=theme, tone=tone, max_rounds=max_rounds)
         self.language = language
 
-        # Each agent has its own running message history so context accumulates
-        self._writer_messages: List[Dict] = []
-        self._director_messages: List[Dict] = []
+        # Single shared transcript instead of one history per agent.  Each turn
+        # is stored once as {"speaker": "writer" | "director" | "summary",
+        # "content": str}; _messages_for() projects it into the user/assistant
+        # view each agent needs.  Previously every turn was stored twice (once
+        # per agent history), doubling resident context memory.
+        self._transcript: List[Dict] = []
+
+        # Render every session-stable prompt exactly once.  Reusing the same
+        # string objects across rounds avoids repeated template formatting and
+        # keeps the prompts byte-identical, which is what Anthropic's prompt
+        # cache hashes on.
+        self._writer_system = PromptRegistry.get("story_writer_system")
+        self._director_system = PromptRegistry.get("director_system")
+        self._writer_opening = PromptRegistry.get(
+            "story_writer_opening",
+            genre=genre, theme=theme, tone=tone, language=language,
+        )
+        self._final_prompt = PromptRegistry.get(
+            "director_final_round", language=language
+        )
 
     # ── Public API ────────────────────────────────────────────────────────────
 
@@ -73,6 +162,8 @@ class PlayWritingSession:
           {"type": "director_chunk", "text": str}
           {"type": "director_done",  "text": str, "round": int}
           {"type": "final_done",     "text": str}
+          {"type": "cache_stats",    "input_tokens": int, "cache_read_input_tokens": int,
+                                     "cache_creation_input_tokens": int}
           {"type": "warning",        "text": str}   # emitted if a response was truncated
           {"type": "error",          "text": str}
         """
@@ -81,13 +172,19 @@ class PlayWritingSession:
         for round_num in range(1, max_rounds + 1):
             yield {"type": "round_start", "round": round_num, "max": max_rounds}
 
+            # Keep per-round input tokens bounded: once the transcript gets big,
+            # collapse older rounds into a summary.  Full transcripts are still
+            # preserved in self.play.rounds via add_round.
+            if round_num > 2:
+                self._compact_transcript()
+
             # ── Writer turn ──────────────────────────────────────────────────
             writer_prompt = self._build_writer_prompt(round_num)
             writer_text = ""
             try:
-                writer_text, stop_reason = yield from self._stream_agent_events(
-                    system=PromptRegistry.get("story_writer_system"),
-                    messages=self._writer_messages,
+                writer_text, stop_reason, _ = yield from self._stream_agent_events(
+                    system=self._writer_system,
+                    messages=self._messages_for("writer"),
                     user_message=writer_prompt,
                     max_tokens=MAX_TOKENS_ROUND,
                     event_type="writer_chunk",
@@ -100,11 +197,8 @@ class PlayWritingSession:
                 yield {"type": "error", "text": f"Writer error: {exc}"}
                 return
 
-            # Append writer's turn to both histories so each agent sees context
-            self._append_message(self._writer_messages, "user", writer_prompt)
-            self._append_message(self._writer_messages, "assistant", writer_text)
-            # Director sees writer output as a "user" message
-            self._append_message(self._director_messages, "user", writer_text)
+            # One shared entry — both agents see it via _messages_for
+            self._transcript.append({"speaker": "writer", "content": writer_text})
 
             yield {"type": "writer_done", "text": writer_text, "round": round_num}
 
@@ -112,9 +206,9 @@ class PlayWritingSession:
             director_prompt = self._build_director_prompt(round_num, writer_text)
             director_text = ""
             try:
-                director_text, stop_reason = yield from self._stream_agent_events(
-                    system=PromptRegistry.get("director_system"),
-                    messages=self._director_messages,
+                director_text, stop_reason, _ = yield from self._stream_agent_events(
+                    system=self._director_system,
+                    messages=self._messages_for("director"),
                     user_message=director_prompt,
                     max_tokens=MAX_TOKENS_ROUND,
                     event_type="director_chunk",
@@ -126,24 +220,26 @@ class PlayWritingSession:
                 yield {"type": "error", "text": f"Director error: {exc}"}
                 return
 
-            # Append director's turn to both histories
-            self._append_message(self._director_messages, "assistant", director_text)
-            # Writer sees director's feedback as a "user" message next round
-            self._append_message(self._writer_messages, "user",
-                                 f"[Director's feedback]\n{director_text}")
+            self._transcript.append({"speaker": "director", "content": director_text})
 
             self.play.add_round(round_num, writer_text, director_text)
             yield {"type": "director_done", "text": director_text, "round": round_num}
 
+        # ── Fast path: last Director turn already produced the final script ──
+        if director_text.rstrip().endswith(FINAL_READY_MARKER):
+            final_text = director_text.rstrip()[: -len(FINAL_READY_MARKER)].rstrip()
+            self.play.final_script = final_text
+            yield {"type": "final_done", "text": final_text}
+            return
+
         # ── Final script (Director synthesises everything) ───────────────────
         # Uses MAX_TOKENS_FINAL per call AND continues automatically if the
         # model hits the token ceiling, so the play is never cut off.
-        final_prompt = PromptRegistry.get("director_final_round", language=self.language)
         try:
             final_text = yield from self._stream_with_continuation(
-                system=PromptRegistry.get("director_system"),
-                base_messages=self._director_messages,
-                user_message=final_prompt,
+                system=self._director_system,
+                base_messages=self._messages_for("director"),
+                user_message=self._final_prompt,
                 event_type="director_chunk",
             )
         except Exception as exc:
@@ -153,6 +249,84 @@ class PlayWritingSession:
         self.play.final_script = final_text
         yield {"type": "final_done", "text": final_text}
 
+    def run_batch(self) -> Generator[dict, None, None]:
+        """
+        Run the discussion through the Message Batches API (~50% input/output
+        cost) instead of live streaming.
+
+        Rounds still execute in order — each turn depends on the previous one —
+        but every call is submitted as a one-request batch, trading latency
+        (batches are processed asynchronously) for halved token cost.  Intended
+        for CLI / scheduled runs where nobody is watching the stream.
+
+        Yields the coarse subset of run_streaming's events: round_start,
+        writer_done, director_done, final_done, warning, and error.
+        """
+        max_rounds = self.play.max_rounds
+
+        for round_num in range(1, max_rounds + 1):
+            yield {"type": "round_start", "round": round_num, "max": max_rounds}
+
+            if round_num > 2:
+                self._compact_transcript()
+
+            try:
+                writer_text, stop_reason = self._batch_call(
+                    system=self._writer_system,
+                    messages=self._messages_for("writer"),
+                    user_message=self._build_writer_prompt(round_num),
+                    max_tokens=MAX_TOKENS_ROUND,
+                )
+            except Exception as exc:
+                yield {"type": "error", "text": f"Writer error: {exc}"}
+                return
+            if stop_reason == "max_tokens":
+                yield {"type": "warning",
+                       "text": f"Round {round_num} Writer response was truncated."}
+            self._transcript.append({"speaker": "writer", "content": writer_text})
+            yield {"type": "writer_done", "text": writer_text, "round": round_num}
+
+            try:
+                director_text, stop_reason = self._batch_call(
+                    system=self._director_system,
+                    messages=self._messages_for("director"),
+                    user_message=self._build_director_prompt(round_num, writer_text),
+                    max_tokens=MAX_TOKENS_ROUND,
+                )
+            except Exception as exc:
+                yield {"type": "error", "text": f"Director error: {exc}"}
+                return
+            if stop_reason == "max_tokens":
+                yield {"type": "warning",
+                       "text": f"Round {round_num} Director response was truncated."}
+            self._transcript.append({"speaker": "director", "content": director_text})
+            self.play.add_round(round_num, writer_text, director_text)
+            yield {"type": "director_done", "text": director_text, "round": round_num}
+
+        if director_text.rstrip().endswith(FINAL_READY_MARKER):
+            final_text = director_text.rstrip()[: -len(FINAL_READY_MARKER)].rstrip()
+            self.play.final_script = final_text
+            yield {"type": "final_done", "text": final_text}
+            return
+
+        try:
+            final_text, stop_reason = self._batch_call(
+                system=self._director_system,
+                messages=self._messages_for("director"),
+                user_message=self._final_prompt,
+                max_tokens=MAX_TOKENS_FINAL,
+            )
+        except Exception as exc:
+            yield {"type": "error", "text": f"Final script error: {exc}"}
+            return
+        if stop_reason == "max_tokens":
+            yield {"type": "warning",
+                   "text": "The final script hit the token ceiling and may be "
+                           "incomplete — use run_streaming for auto-continuation."}
+
+        self.play.final_script = final_text
+        yield {"type": "final_done", "text": final_text}
+
     def save_script(self, path: str = "play_script.txt") -> None:
         """Write the final play script to disk."""
         with open(path, "w", encoding="utf-8") as f:
@@ -163,36 +337,36 @@ class PlayWritingSession:
     def _build_writer_prompt(self, round_num: int) -> str:
         """Compose the instruction the Writer receives at the start of each round."""
         if round_num == 1:
-            # First turn: kick things off with the pitch
-            return PromptRegistry.get(
-                "story_writer_opening",
-                genre=self.play.genre,
-                theme=self.play.theme,
-                tone=self.play.tone,
-                language=self.language,
-            )
-        # Subsequent turns: continue developing based on director's last note
+            # First turn: kick things off with the pitch (rendered in __init__)
+            return self._writer_opening
+        # Subsequent turns: a bare round marker — the durable revision
+        # instructions live in the system prompt now, so re-sending them
+        # every round would only inflate billed input tokens.
         return (
-            f"Round {round_num} of {self.play.max_rounds}. "
-            "The Director has given you feedback above. "
-            "Revise and expand the script, incorporating their best suggestions. "
-            "Be creative and specific — write actual dialogue and stage directions. "
-            f"Remember: write entirely in {self.language}."
+            f"[Round {round_num} of {self.play.max_rounds}] "
+            f"Revise per the Director's feedback above, in {self.language}."
         )
 
     def _build_director_prompt(self, round_num: int, writer_text: str) -> str:
         """Compose the instruction the Director receives after the Writer speaks."""
-        if round_num == self.play.max_rounds:
-            # Last round handled separately as final_script step
-            pass
-        return (
-            f"[Round {round_num} of {self.play.max_rounds}]\n\n"
-            "Here is the Writer's latest draft:\n\n"
-            f"{writer_text}\n\n"
-            "Give your directorial critique: what works brilliantly, what needs fixing, "
-            "and concrete rewrite suggestions. Be specific and demanding. "
-            f"All your suggestions and any rewritten lines must be in {self.language}."
+        # The Writer's draft is already the preceding message in the Director's
+        # history — re-embedding it here would double its token cost.  The
+        # durable critique instructions live in the system prompt.
+        prompt = (
+            f"[Round {round_num} of {self.play.max_rounds}] "
+            "Critique the Writer's draft above. "
+            f"All suggestions and rewritten lines in {self.language}."
         )
+        if round_num == self.play.max_rounds:
+            # Invite the Director to finish here if the draft is already done —
+            # seeing FINAL_READY_MARKER lets run_streaming skip the synthesis call.
+            prompt += (
+                "\n\nThis is the last discussion round. If the Writer's draft is "
+                "already a complete, performance-ready script, output the full "
+                "final script instead of a critique and end your response with "
+                f"{FINAL_READY_MARKER} on its own line. Otherwise critique as usual."
+            )
+        return prompt
 
     def _stream_agent_events(
         self,
@@ -203,27 +377,98 @@ class PlayWritingSession:
         event_type: str,
     ) -> Generator[dict, None, tuple]:
         """
-        Stream ONE API call, yield UI chunk events, return (full_text, stop_reason).
+        Stream ONE API call, yield UI chunk events, and return
+        (full_text, stop_reason, output_tokens).
 
         stop_reason == "end_turn"    → response is complete
         stop_reason == "max_tokens" → response was cut off; caller should continue
+
+        The system prompt and the last message of the stable history prefix are
+        marked with `cache_control` breakpoints so Anthropic serves them from
+        its prompt cache on rounds 2..N (and on continuation retries) instead
+        of re-billing the full prefix every call.
         """
-        call_messages = messages + [{"role": "user", "content": user_message}]
+        call_messages = list(messages)
+        if call_messages:
+            # Breakpoint on the end of the stable prefix — everything before the
+            # new user message is identical across this and future calls.
+            call_messages[-1] = _cached_message(call_messages[-1])
+        call_messages.append({"role": "user", "content": user_message})
+        system_blocks = [
+            {"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}
+        ]
         full_text = ""
 
-        with self.client.messages.stream(
-            model=MODEL,
-            max_tokens=max_tokens,
-            system=system,
-            messages=call_messages,
-        ) as stream:
-            for text in stream.text_stream:
-                full_text += text
-                yield {"type": event_type, "text": text}
-
-            stop_reason = stream.get_final_message().stop_reason
+        # The stream is consumed on a worker thread feeding a queue, so
+        # network reads continue while the caller (typically the Streamlit UI)
+        # is busy rendering between yields.  A full asyncio port would not help
+        # here — the frontend consumes this as a plain sync generator — but the
+        # reader thread recovers most of the same I/O overlap.  The queue is
+        # unbounded on purpose: Streamlit routinely abandons the consuming
+        # generator mid-stream (user stop, rerun), and a bounded queue would
+        # then block the pump on put() forever, leaking the thread and holding
+        # the HTTP stream open.  Worst case it buffers one response's text.
+        events: queue.Queue = queue.Queue()
+
+        def _pump() -> None:
+            try:
+                with self.client.messages.stream(
+                    model=MODEL,
+                    max_tokens=max_tokens,
+                    system=system_blocks,
+                    messages=call_messages,
+                    extra_headers={"anthropic-beta": "prompt-caching-2024-07-31"},
+                ) as stream:
+                    for text in stream.text_stream:
+                        events.put(("text", text))
+                    final = stream.get_final_message()
+                    events.put(("done", (final.stop_reason, final.usage)))
+            except Exception as exc:  # surfaced on the consumer thread below
+                events.put(("error", exc))
+
+        pump = threading.Thread(target=_pump, daemon=True)
+        pump.start()
+
+        pending: List[str] = []
+        pending_len = 0
+        last_flush = time.monotonic()
+
+        while True:
+            kind, payload = events.get()
+            if kind == "text":
+                full_text += payload
+                pending.append(payload)
+                pending_len += len(payload)
+                now = time.monotonic()
+                if pending_len >= _FLUSH_CHARS or now - last_flush >= _FLUSH_SECONDS:
+                    yield {"type": event_type, "text": "".join(pending)}
+                    pending.clear()
+                    pending_len = 0
+                    last_flush = now
+            elif kind == "done":
+                if pending:
+                    # Always flush the tail before reporting completion.
+                    yield {"type": event_type, "text": "".join(pending)}
+                    pending.clear()
+                stop_reason, usage = payload
+                output_tokens = getattr(usage, "output_tokens", 0) or 0
+                yield {
+                    "type": "cache_stats",
+                    "input_tokens": getattr(usage, "input_tokens", None),
+                    "cache_read_input_tokens": getattr(
+                        usage, "cache_read_input_tokens", None
+                    ),
+                    "cache_creation_input_tokens": getattr(
+                        usage, "cache_creation_input_tokens", None
+                    ),
+                }
+                break
+            else:
+                pump.join()
+                raise payload
 
-        return full_text, stop_reason
+        pump.join()
+        return full_text, stop_reason, output_tokens
 
     def _stream_with_continuation(
         self,
@@ -237,30 +482,41 @@ class PlayWritingSession:
 
         If the model hits the token ceiling (stop_reason == "max_tokens") we
         immediately make another call, passing the partial response as an
-        assistant turn and asking the model to keep writing.  We repeat up to
-        MAX_CONTINUATIONS times, then stop (yielding a warning if still incomplete).
+        assistant turn and asking the model to keep writing.
+
+        The first call asks for MAX_TOKENS_FINAL_INITIAL tokens; the budget
+        only expands to MAX_TOKENS_FINAL once the model demonstrably hits the
+        ceiling.  Total output is tracked from per-call usage and capped at
+        FINAL_OUTPUT_HARD_CAP so the token cost of continuations (each of
+        which replays the accumulated script) stays bounded and predictable.
 
         Returns the complete accumulated text.
         """
-        # Working copy of the message history — we extend it as we continue.
+        # Working copy of the message history — mutated in place per attempt
+        # rather than rebound via `+`, which would re-copy the whole (long)
+        # history on every continuation.
         messages = list(base_messages)
-        accumulated = ""
+        parts: List[str] = []
+        total_output = 0
+        attempt = 0
+        max_tokens = MAX_TOKENS_FINAL_INITIAL
 
-        for attempt in range(MAX_CONTINUATIONS + 1):
-            chunk, stop_reason = yield from self._stream_agent_events(
+        while True:
+            chunk, stop_reason, output_tokens = yield from self._stream_agent_events(
                 system=system,
                 messages=messages,
                 user_message=user_message,
-                max_tokens=MAX_TOKENS_FINAL,
+                max_tokens=max_tokens,
                 event_type=event_type,
             )
-            accumulated += chunk
+            parts.append(chunk)
+            total_output += output_tokens
 
             if stop_reason != "max_tokens":
                 # Model finished naturally — we're done.
                 break
 
-            if attempt == MAX_CONTINUATIONS:
+            if attempt >= MAX_CONTINUATIONS or total_output >= FINAL_OUTPUT_HARD_CAP:
                 # Exhausted continuation budget.
                 yield {
                     "type": "warning",
@@ -272,26 +528,147 @@ class PlayWritingSession:
                 }
                 break
 
+            # The model needs more room — expand to the full per-call ceiling
+            # for subsequent attempts.
+            max_tokens = MAX_TOKENS_FINAL
+
             # ── Continue: feed partial response back, ask model to proceed ──
-            # Add the user prompt and the partial assistant response to history.
-            messages = messages + [
-                {"role": "user",      "content": user_message},
-                {"role": "assistant", "content": accumulated},
-            ]
+            # The partial script is by far the largest block being replayed, so
+            # mark it as a cache breakpoint: the next continuation reads it at
+            # cached input rates.
+            messages.append({"role": "user", "content": user_message})
+            messages.append(
+                _cached_message({"role": "assistant", "content": "".join(parts)})
+            )
             # New user prompt asks the model to resume exactly where it stopped.
             user_message = (
                 "Continue writing the play script exactly from where you stopped. "
                 "Do NOT repeat anything already written. "
                 "Pick up mid-sentence if needed and carry on to the end."
             )
+            attempt += 1
             yield {
                 "type": "warning",
-                "text": f"Script is long — fetching continuation {attempt + 1} of {MAX_CONTINUATIONS}…",
+                "text": f"Script is long — fetching continuation {attempt} of {MAX_CONTINUATIONS}…",
             }
 
-        return accumulated
+        return "".join(parts)
+
+    def _batch_call(
+        self,
+        system: str,
+        messages: List[Dict],
+        user_message: str,
+        max_tokens: int,
+    ) -> tuple:
+        """
+        Execute ONE turn as a single-request message batch and block until it
+        completes.  Returns (text, stop_reason).
+
+        The request body mirrors _stream_agent_events, including the prompt
+        cache breakpoints, so batch and streaming runs share cached prefixes.
+        """
+        call_messages = list(messages)
+        if call_messages:
+            call_messages[-1] = _cached_message(call_messages[-1])
+        call_messages.append({"role": "user", "content": user_message})
+
+        batch = self.client.messages.batches.create(
+            requests=[{
+                "custom_id": "turn",
+                "params": {
+                    "model": MODEL,
+                    "max_tokens": max_tokens,
+                    "system": [{
+                        "type": "text",
+                        "text": system,
+                        "cache_control": {"type": "ephemeral"},
+                    }],
+                    "messages": call_messages,
+                },
+            }],
+        )
+        while batch.processing_status != "ended":
+            time.sleep(BATCH_POLL_SECONDS)
+            batch = self.client.messages.batches.retrieve(batch.id)
+
+        for result in self.client.messages.batches.results(batch.id):
+            if result.result.type != "succeeded":
+                raise RuntimeError(f"Batch request {result.result.type}")
+            message = result.result.message
+            text = "".join(
+                block.text for block in message.content
+                if getattr(block, "type", "") == "text"
+            )
+            return text, message.stop_reason
+
+        raise RuntimeError("Batch completed but returned no results")
+
+    def _messages_for(self, agent: str) -> List[Dict]:
+        """
+        Project the shared transcript into the message view *agent* expects.
+
+        The agent's own turns become "assistant" messages; the other agent's
+        turns (and any compaction summary) become "user" messages.  The Writer
+        additionally sees the opening pitch at the head of its history and the
+        Director's turns labelled as feedback — matching what each agent saw
+        when histories were kept separately, at half the memory.
+        """
+        messages: List[Dict] = []
+        if agent == "writer" and self._transcript:
+            messages.append({"role": "user", "content": self._writer_opening})
+
+        for entry in self._transcript:
+            speaker, content = entry["speaker"], entry["content"]
+            if speaker == agent:
+                messages.append({"role": "assistant", "content": content})
+            elif speaker == "director":
+                messages.append(
+                    {"role": "user", "content": f"[Director's feedback]\n{content}"}
+                )
+            else:  # a writer turn or a compaction summary, seen by the other agent
+                messages.append({"role": "user", "content": content})
+        return messages
+
+    def _compact_transcript(self) -> None:
+        """
+        Collapse all but the most recent exchange into a bullet-form summary.
+
+        Uses COMPACT_MODEL (cheaper than the main agents) to recap the older
+        turns, then replaces them with a single "summary" transcript entry
+        followed by the last two turns verbatim.  If the transcript is still
+        under COMPACT_THRESHOLD_CHARS — or the summarisation call fails — it
+        is left unchanged.
+        """
+        if sum(len(e["content"]) for e in self._transcript) <= COMPACT_THRESHOLD_CHARS:
+            return
+        if len(self._transcript) <= 2:
+            return
+
+        head, tail = self._transcript[:-2], self._transcript[-2:]
+        transcript_text = "\n\n".join(
+            f"[{e['speaker'].upper()}]\n{e['content']}" for e in head
+        )
+        try:
+            response = self.client.messages.create(
+                model=COMPACT_MODEL,
+                max_tokens=COMPACT_MAX_TOKENS,
+                messages=[{
+                    "role": "user",
+                    "content": (
+                        "Summarise the following play-writing discussion as "
+                        "concise bullet points. Preserve the plot, characters, "
+                        "agreed structure, and every still-open directorial "
+                        "note. Output only the bullets.\n\n" + transcript_text
+                    ),
+                }],
+            )
+            summary = response.content[0].text
+        except Exception:
+            # Compaction is an optimisation — never let it break the session.
+            return
 
-    @staticmethod
-    def _append_message(history: List[Dict], role: str, content: str) -> None:
-        """Append a role/content pair to a message history list."""
-        history.append({"role": role, "content": content})
+        self._transcript = [
+            {"speaker": "summary",
+             "content": f"[Prior discussion summary]\n{summary}"},
+        ] + tail
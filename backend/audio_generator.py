@@ -13,16 +13,22 @@ Silence is inserted between segments:
   - 800 ms after headings
 """
 
+import atexit
+import hashlib
 import io
 import os
 import re
 import wave
-import struct
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from itertools import cycle
-from typing import Dict, Generator, List
+from tempfile import SpooledTemporaryFile
+from typing import Dict, Generator, List, Optional
 
+import httpx
 import openai
 
+from backend import tts_cache
 from backend.script_parser import ScriptSegment
 
 # ── Voice constants ────────────────────────────────────────────────────────────
@@ -32,16 +38,98 @@ CHARACTER_VOICES = ["alloy", "echo", "onyx", "nova", "shimmer"]
 COMEDIAN_VOICES = ["alloy", "echo", "fable", "onyx", "nova", "shimmer"]
 
 TTS_MODEL = "tts-1"
-TTS_RESPONSE_FORMAT = "wav"
+# Raw PCM (24 kHz, 16-bit, mono, little-endian) — no RIFF header to parse and
+# strip off every response; bytes go straight into the stitcher.
+TTS_RESPONSE_FORMAT = "pcm"
 
 # OpenAI tts-1 accepts up to 4 096 chars; stay safely under
 _OPENAI_MAX_CHARS = 4000
 
+# Sentence-ending punctuation (Latin + Devanagari danda), compiled once at
+# import instead of relying on re's small shared pattern cache per call.
+_SENT_SPLIT = re.compile(r"(?<=[.!?।])\s+")
+
 # Silence durations in milliseconds
 _SILENCE_AFTER_DIALOGUE_MS = 300
 _SILENCE_AFTER_HEADING_MS = 800
 _SILENCE_DEFAULT_MS = 300
 
+# Shared OpenAI client.  Constructing a client builds a fresh httpx pool and
+# TLS context, so reuse one per process — repeated comedian/audio generations
+# then keep their HTTP connections alive instead of re-handshaking.
+# The injected httpx client multiplexes the many small concurrent TTS requests
+# over a few pooled connections (HTTP/2 when the optional `h2` extra is
+# installed) instead of the SDK's per-client defaults.
+_OPENAI_CLIENT: Optional[openai.OpenAI] = None
+
+
+def _make_http_client() -> httpx.Client:
+    """Build the pooled transport shared by all OpenAI TTS calls."""
+    limits = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+    try:
+        return httpx.Client(http2=True, timeout=60.0, limits=limits)
+    except ImportError:
+        # h2 not installed — HTTP/1.1 with keep-alive is still pooled.
+        return httpx.Client(timeout=60.0, limits=limits)
+
+
+def _get_openai() -> openai.OpenAI:
+    """Return the lazily-initialised module-wide OpenAI client."""
+    global _OPENAI_CLIENT
+    if _OPENAI_CLIENT is None:
+        http_client = _make_http_client()
+        _OPENAI_CLIENT = openai.OpenAI(
+            api_key=os.environ["OPENAI_API_KEY"],
+            http_client=http_client,
+        )
+        atexit.register(http_client.close)
+    return _OPENAI_CLIENT
+
+
+@lru_cache(maxsize=8)
+def _make_silence(
+    duration_ms: int, sample_rate: int, n_channels: int, sampwidth: int
+) -> bytes:
+    """Generate *duration_ms* milliseconds of silent PCM frames.
+
+    Only two distinct durations occur per play, so the buffers are cached and
+    the same bytes object is reused between segments.
+    """
+    # Silent PCM is all-zero bytes — one C-level allocation, no per-sample work.
+    n_samples = int(sample_rate * duration_ms / 1000) * n_channels
+    return b"\x00" * (n_samples * sampwidth)
+
+
+def _tts_pcm(client: openai.OpenAI, text: str, voice: str) -> bytes:
+    """
+    Synthesise one chunk of *text* with *voice*, via the shared disk cache.
+
+    Scripts repeat short phrases across regenerations ("Beat.", "Curtain.",
+    scene headings), and a revision loop re-synthesises mostly-unchanged
+    segments.  Keying on (model, voice, text) serves those straight from the
+    content-addressed PCM cache — the same one the Sarvam backend uses.
+    """
+    cache_key = hashlib.blake2b(
+        f"openai|{TTS_MODEL}|{voice}|{text}".encode(), digest_size=16
+    ).hexdigest()
+    cached = tts_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    response = client.audio.speech.create(
+        model=TTS_MODEL,
+        voice=voice,
+        input=text,
+        response_format=TTS_RESPONSE_FORMAT,
+    )
+    tts_cache.put(cache_key, response.content)
+    return response.content
+
+
+# How many TTS requests may be in flight at once.  The calls are independent,
+# so overlapping them collapses total wall time from the sum of round-trips to
+# roughly max(latency) x ceil(segments / concurrency).
+_MAX_CONCURRENT_TTS = 8
+
 
 class AudioGenerator:
     """
@@ -58,66 +146,120 @@ class AudioGenerator:
     """
 
     def __init__(self):
-        self._client = openai.OpenAI(api_key=os.environ["OPENAI_API_KEY"])
+        self._client = _get_openai()
         self._character_voice_map: Dict[str, str] = {}
         self._voice_cycle = cycle(CHARACTER_VOICES)
 
     # ── Public API ────────────────────────────────────────────────────────────
 
     def generate_audio_play(
-        self, segments: List[ScriptSegment]
+        self, segments: List[ScriptSegment], out_path: Optional[str] = None
     ) -> Generator[dict, None, None]:
         """
-        Yield progress events and, as the final event, the combined WAV bytes.
+        Yield progress events and, as the final event, the combined WAV.
+
+        Segments are written to the output WAV as soon as they (and all their
+        predecessors) are synthesised, so peak memory is bounded by the few
+        out-of-order results in flight rather than the whole play.  With the
+        default ``out_path=None`` the WAV is assembled in a spooled temp file
+        and returned as bytes; pass a path to stream it to disk instead, in
+        which case audio_done carries ``path`` and ``wav_bytes`` is None.
 
         Yielded event shapes:
           {"type": "audio_progress", "current": int, "total": int, "speaker": str}
-          {"type": "audio_done",     "wav_bytes": bytes, "voice_map": dict}
+          {"type": "audio_done",     "wav_bytes": bytes | None, "path": str | None,
+                                     "voice_map": dict}
           {"type": "audio_error",    "text": str}
         """
         total = len(segments)
-        all_frames: List[bytes] = []
-        sample_rate = 24000  # OpenAI TTS WAV output is 24 kHz, 16-bit, mono
+        sample_rate = 24000  # OpenAI TTS PCM output is 24 kHz, 16-bit, mono
         n_channels = 1
         sampwidth = 2  # 16-bit = 2 bytes
 
-        for idx, segment in enumerate(segments, start=1):
-            yield {
-                "type": "audio_progress",
-                "current": idx,
-                "total": total,
-                "speaker": segment.speaker,
-            }
-
-            voice = self._get_voice(segment)
-
-            try:
-                wav_bytes = self._synthesise(segment.text, voice)
-            except Exception as exc:
-                yield {"type": "audio_error", "text": f"TTS error on segment {idx}: {exc}"}
-                return
+        sink = open(out_path, "wb") if out_path else SpooledTemporaryFile(max_size=8 << 20)
+        wf = wave.open(sink, "wb")
+        wf.setnchannels(n_channels)
+        wf.setsampwidth(sampwidth)
+        wf.setframerate(sample_rate)
 
-            frames = self._extract_frames(wav_bytes)
-            all_frames.extend(frames)
-
-            # Append silence between segments
-            silence_ms = (
-                _SILENCE_AFTER_HEADING_MS
-                if segment.segment_type == "heading"
-                else _SILENCE_AFTER_DIALOGUE_MS
-            )
-            all_frames.append(
-                self._make_silence(silence_ms, sample_rate, n_channels, sampwidth)
-            )
-
-        # Stitch into one WAV
-        combined_wav = self._combine_frames(
-            all_frames, sample_rate, n_channels, sampwidth
-        )
+        # Completed segments not yet written (finished out of order).
+        pending: Dict[int, bytes] = {}
+        next_to_write = 0
+
+        def _write_ready() -> None:
+            """Flush every segment whose predecessors are already written."""
+            nonlocal next_to_write
+            while next_to_write in pending:
+                wf.writeframesraw(pending.pop(next_to_write))
+                silence_ms = (
+                    _SILENCE_AFTER_HEADING_MS
+                    if segments[next_to_write].segment_type == "heading"
+                    else _SILENCE_AFTER_DIALOGUE_MS
+                )
+                wf.writeframesraw(
+                    _make_silence(silence_ms, sample_rate, n_channels, sampwidth)
+                )
+                next_to_write += 1
+
+        # Assign every voice up front with a single pass in script order.
+        # Voice assignment is tied to order of first appearance, so doing it
+        # before dispatch keeps the mapping deterministic regardless of which
+        # concurrent request completes first — and the full voice_map exists
+        # before the first byte of audio is requested.
+        voices = [self._get_voice(segment) for segment in segments]
+
+        finished = False
+        try:
+            # Synthesis calls are independent, so dispatch them concurrently;
+            # results are written to the WAV in index order.
+            with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_TTS) as pool:
+                futures = {}
+                for idx, segment in enumerate(segments):
+                    futures[pool.submit(self._synthesise, segment.text, voices[idx])] = idx
+
+                for done, future in enumerate(as_completed(futures), start=1):
+                    idx = futures[future]
+                    try:
+                        pending[idx] = future.result()
+                    except Exception as exc:
+                        yield {
+                            "type": "audio_error",
+                            "text": f"TTS error on segment {idx + 1}: {exc}",
+                        }
+                        return
+                    _write_ready()
+                    yield {
+                        "type": "audio_progress",
+                        "current": done,
+                        "total": total,
+                        "speaker": segments[idx].speaker,
+                    }
+
+            wf.close()  # patches the RIFF header with the final frame count
+            if out_path:
+                wav_bytes = None
+            else:
+                sink.seek(0)
+                wav_bytes = sink.read()
+            finished = True
+        finally:
+            # Close wf before sink; wave's close() is a no-op if the success
+            # path already ran it, and on the error path it must patch the
+            # header while the underlying file is still open — otherwise the
+            # eventual Wave_write.__del__ writes to a closed file.
+            wf.close()
+            sink.close()
+            if not finished and out_path:
+                # Don't leave a truncated WAV behind on failure.
+                try:
+                    os.remove(out_path)
+                except OSError:
+                    pass
 
         yield {
             "type": "audio_done",
-            "wav_bytes": combined_wav,
+            "wav_bytes": wav_bytes,
+            "path": out_path,
             "voice_map": dict(self._character_voice_map),
         }
 
@@ -132,29 +274,23 @@ class AudioGenerator:
         return self._character_voice_map[segment.speaker]
 
     def _synthesise(self, text: str, voice: str) -> bytes:
-        """Call OpenAI TTS and return raw WAV bytes."""
-        response = self._client.audio.speech.create(
-            model=TTS_MODEL,
-            voice=voice,
-            input=text,
-            response_format=TTS_RESPONSE_FORMAT,
-        )
-        return response.content
+        """
+        Call OpenAI TTS and return raw PCM bytes.
 
-    @staticmethod
-    def _extract_frames(wav_bytes: bytes) -> List[bytes]:
-        """Read raw PCM frames from a WAV byte-string."""
-        with wave.open(io.BytesIO(wav_bytes), "rb") as wf:
-            frames = wf.readframes(wf.getnframes())
-        return [frames]
+        Text longer than the OpenAI per-request character limit is split at
+        sentence boundaries and the resulting PCM chunks are concatenated —
+        previously an oversized stage direction would simply fail the call.
+        Segment-level parallelism is already provided by the dispatch pool in
+        generate_audio_play, so sub-chunks are fetched in-line here.
+        """
+        chunks = _split_text(text, _OPENAI_MAX_CHARS)
+        if len(chunks) == 1:
+            return self._synthesise_chunk(chunks[0], voice)
+        return b"".join(self._synthesise_chunk(chunk, voice) for chunk in chunks)
 
-    @staticmethod
-    def _make_silence(
-        duration_ms: int, sample_rate: int, n_channels: int, sampwidth: int
-    ) -> bytes:
-        """Generate *duration_ms* milliseconds of silent PCM frames."""
-        n_samples = int(sample_rate * duration_ms / 1000) * n_channels
-        return struct.pack(f"<{n_samples}h", *([0] * n_samples))
+    def _synthesise_chunk(self, text: str, voice: str) -> bytes:
+        """One cache-backed TTS call for text already under the character limit."""
+        return _tts_pcm(self._client, text, voice)
 
     @staticmethod
     def _combine_frames(
@@ -169,8 +305,10 @@ class AudioGenerator:
             wf.setnchannels(n_channels)
             wf.setsampwidth(sampwidth)
             wf.setframerate(sample_rate)
-            for chunk in frame_chunks:
-                wf.writeframes(chunk)
+            # One write instead of one per chunk — writeframes patches the
+            # header nframes count (with a seek/tell pair) on every call, so
+            # join the PCM first and pay that cost exactly once.
+            wf.writeframes(b"".join(frame_chunks))
         return buf.getvalue()
 
 
@@ -190,41 +328,40 @@ def generate_comedian_audio(
       {"type": "audio_done",     "wav_bytes": bytes, "voice_map": dict}
       {"type": "audio_error",    "text": str}
     """
-    client = openai.OpenAI(api_key=os.environ["OPENAI_API_KEY"])
+    client = _get_openai()
     chunks = _split_text(text, _OPENAI_MAX_CHARS)
     total = len(chunks)
     sample_rate, n_channels, sampwidth = 24000, 1, 2
     all_frames: List[bytes] = []
 
-    for i, chunk in enumerate(chunks, 1):
-        yield {"type": "audio_progress", "current": i, "total": total, "speaker": "COMEDIAN"}
-        try:
-            response = client.audio.speech.create(
-                model=TTS_MODEL, voice=voice,
-                input=chunk, response_format=TTS_RESPONSE_FORMAT,
-            )
-        except Exception as exc:
-            yield {"type": "audio_error", "text": f"OpenAI TTS error: {exc}"}
-            return
-        with wave.open(io.BytesIO(response.content), "rb") as wf:
-            all_frames.append(wf.readframes(wf.getnframes()))
-
-    buf = io.BytesIO()
-    with wave.open(buf, "wb") as wf:
-        wf.setnchannels(n_channels)
-        wf.setsampwidth(sampwidth)
-        wf.setframerate(sample_rate)
-        for frames in all_frames:
-            wf.writeframes(frames)
+    def _synth_chunk(text_chunk: str) -> bytes:
+        return _tts_pcm(client, text_chunk, voice)
+
+    # Chunks are independent — synthesise them concurrently, keeping results
+    # slotted by index so concatenation stays in reading order.
+    results: List[Optional[bytes]] = [None] * total
+    with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_TTS) as pool:
+        futures = {pool.submit(_synth_chunk, chunk): i for i, chunk in enumerate(chunks)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            idx = futures[future]
+            try:
+                results[idx] = future.result()
+            except Exception as exc:
+                yield {"type": "audio_error", "text": f"OpenAI TTS error: {exc}"}
+                return
+            yield {"type": "audio_progress", "current": done, "total": total, "speaker": "COMEDIAN"}
+
+    all_frames.extend(results)
 
-    yield {"type": "audio_done", "wav_bytes": buf.getvalue(), "voice_map": {"COMEDIAN": voice}}
+    combined = AudioGenerator._combine_frames(all_frames, sample_rate, n_channels, sampwidth)
+    yield {"type": "audio_done", "wav_bytes": combined, "voice_map": {"COMEDIAN": voice}}
 
 
 def _split_text(text: str, max_chars: int) -> List[str]:
     """Split *text* at sentence boundaries to stay under *max_chars*."""
     if len(text) <= max_chars:
         return [text]
-    sentences = re.split(r"(?<=[.!?।])\s+", text)
+    sentences = _SENT_SPLIT.split(text)
     chunks: List[str] = []
     current = ""
     for sentence in sentences:
@@ -10,9 +10,14 @@ commentary that accompanies every movement, entrance, and bad decision on stage.
 """
 
 import os
-from typing import Generator
+import queue
+import threading
+import time
+from functools import lru_cache
+from typing import Generator, Iterable, Optional
 
 import anthropic
+import httpx
 from dotenv import load_dotenv
 
 from prompts.registry import PromptRegistry
@@ -23,6 +28,107 @@ MODEL = "claude-sonnet-4-6"
 MAX_TOKENS = 64000
 MAX_CONTINUATIONS = 4
 
+# Default chunk-coalescing window: fragments from the SDK stream are merged
+# into one event once the buffer reaches BATCH_CHARS or BATCH_MS has elapsed,
+# whichever comes first.  One event per API token means one generator frame
+# and one frontend repaint per token; batching cuts that overhead roughly by
+# the batch factor while the first flush still lands within one window.
+BATCH_CHARS = 64
+BATCH_MS = 25
+
+# Speculative round-1 critique: the draft prompt hard-caps the script at
+# _DRAFT_WORD_CAP words, so once the streamed draft is within
+# _SPEC_MIN_COVERAGE of that cap the rest is at most a few lines — a
+# background critique started there overlaps the draft tail and the
+# frontend's rendering of the finished draft, and its snapshot is close
+# enough to the final text to stand in for the round-1 critique.  Gating the
+# spawn on the same coverage fraction as the use means the call only fires
+# when it can plausibly be used; a draft that blows past the cap still fails
+# the coverage check below and falls back to the sequential critique.
+_DRAFT_WORD_CAP = 220  # mirrors the prompt's 180–220 word hard limit
+_SPEC_MIN_COVERAGE = 0.95
+SPECULATE_AFTER_WORDS = int(_DRAFT_WORD_CAP * _SPEC_MIN_COVERAGE)
+
+# One Anthropic client per process.  Each construction builds a new httpx
+# client, TLS context, and connection pool, so sharing it saves a handshake
+# per generation and keeps connections warm across the critique loop.
+_CLIENT: Optional[anthropic.Anthropic] = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client() -> anthropic.Anthropic:
+    """Return the lazily-initialised module-wide Anthropic client."""
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = anthropic.Anthropic(
+                    api_key=os.environ["ANTHROPIC_API_KEY"],
+                    max_retries=2,
+                    timeout=httpx.Timeout(60.0, connect=5.0),
+                )
+    return _CLIENT
+
+@lru_cache(maxsize=128)
+def _cached_prompt(name: str, language: Optional[str] = None) -> str:
+    """
+    Memoised PromptRegistry lookup for prompts that depend only on the
+    language (or on nothing).  Repeated rounds then reuse the exact same
+    string object — no re-formatting, and byte-identical system prompts are
+    what Anthropic's prompt cache hashes on.
+    """
+    if language is None:
+        return PromptRegistry.get(name)
+    return PromptRegistry.get(name, language=language)
+
+
+# Opt-in header for Anthropic prompt caching on streamed calls.
+_CACHE_HEADERS = {"anthropic-beta": "prompt-caching-2024-07-31"}
+
+
+def _system_blocks(system: str) -> list:
+    """Wrap a system prompt so Anthropic serves it from the prompt cache."""
+    return [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+
+
+def _script_then_instruction(script_block: str, instruction: str) -> list:
+    """
+    Build a two-block user message: the large, round-stable script first (with
+    a cache breakpoint) followed by the small volatile instruction.  Keeping
+    this layout identical across critique/revision rounds lets the cache serve
+    the script portion on every call after the first.
+    """
+    return [{
+        "role": "user",
+        "content": [
+            {"type": "text", "text": script_block,
+             "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": instruction},
+        ],
+    }]
+
+def _coalesced(fragments: Iterable[str], batch_chars: int, batch_s: float) -> Generator[str, None, None]:
+    """
+    Merge a stream of text fragments into larger pieces, flushing whenever the
+    buffer reaches *batch_chars* or *batch_s* seconds have passed since the
+    last flush.  The tail is always flushed, so no text is ever dropped.
+    """
+    pending: list = []
+    pending_len = 0
+    last_flush = time.monotonic()
+    for text in fragments:
+        pending.append(text)
+        pending_len += len(text)
+        now = time.monotonic()
+        if pending_len >= batch_chars or now - last_flush >= batch_s:
+            yield "".join(pending)
+            pending.clear()
+            pending_len = 0
+            last_flush = now
+    if pending:
+        yield "".join(pending)
+
+
 _MONOLOGUE_SYSTEM = """CRITICAL LANGUAGE RULE: Your entire output MUST be in {language} only.
 Do NOT translate into English. Do NOT switch languages. Every word you speak
 must be in {language}. This overrides all other instructions.
@@ -79,28 +185,79 @@ class FunnyPlayDirectorLoop:
         error            — {"type": "error", "text": str}
     """
 
-    def __init__(self, theme: str, language: str = "English", critique_rounds: int = 2):
+    def __init__(
+        self,
+        theme: str,
+        language: str = "English",
+        critique_rounds: int = 2,
+        parallel: bool = True,
+        batch_chars: int = BATCH_CHARS,
+        batch_ms: int = BATCH_MS,
+    ):
         self.theme = theme
         self.language = language
         self.critique_rounds = critique_rounds
+        # Chunk-coalescing knobs — lower them for live-typing UIs that want
+        # finer-grained updates at the cost of more events.
+        self.batch_chars = batch_chars
+        self.batch_ms = batch_ms
+        # When True, each critique/revision stream is drained on a background
+        # thread so a slow frontend consumer no longer throttles the network
+        # read and the next round starts sooner.  Set False for strictly
+        # sequential, single-threaded behaviour.
+        self.parallel = parallel
         self.final_script: str = ""
-        self._client = anthropic.Anthropic(api_key=os.environ["ANTHROPIC_API_KEY"])
+        self._client = _get_client()
 
     # ── Public API ────────────────────────────────────────────────────────────
 
     def run_streaming(self) -> Generator[dict, None, None]:
         """Stream all events for the full director-critique loop."""
         # 1. Generate initial draft via FunnyPlayGenerator
-        inner = FunnyPlayGenerator(theme=self.theme, language=self.language)
-        inner._client = self._client  # reuse connection
+        inner = FunnyPlayGenerator(
+            theme=self.theme,
+            language=self.language,
+            batch_chars=self.batch_chars,
+            batch_ms=self.batch_ms,
+        )
+
+        # Speculative round-1 critique state.  Once the draft is within
+        # _SPEC_MIN_COVERAGE of the prompt's word cap, a background thread
+        # critiques the partial text so the call overlaps the remaining tail.
+        # spec["critique"] appears only if the call succeeded; spec_words
+        # records how much draft it saw.
+        spec: dict = {}
+        spec_words = 0
+        spec_thread: Optional[threading.Thread] = None
+
+        def _speculate(snapshot: str) -> None:
+            try:
+                spec["critique"] = self._critique_once(snapshot)
+            except Exception:
+                pass  # speculation is best-effort; the sequential path remains
 
         current_script = ""
+        draft_parts: list = []
         try:
             for event in inner.run_streaming():
                 if event["type"] == "done":
                     current_script = event["text"]
                     yield {"type": "initial_done", "text": current_script}
                 else:
+                    if (
+                        self.parallel
+                        and spec_thread is None
+                        and event["type"] == "chunk"
+                    ):
+                        draft_parts.append(event["text"])
+                        snapshot = "".join(draft_parts)
+                        words = len(snapshot.split())
+                        if words >= SPECULATE_AFTER_WORDS:
+                            spec_words = words
+                            spec_thread = threading.Thread(
+                                target=_speculate, args=(snapshot,), daemon=True
+                            )
+                            spec_thread.start()
                     yield event  # forward chunk / warning / error
         except Exception as exc:
             yield {"type": "error", "text": f"Initial generation error: {exc}"}
@@ -114,11 +271,26 @@ class FunnyPlayDirectorLoop:
         for n in range(1, self.critique_rounds + 1):
             yield {"type": "director_start", "round": n, "total": self.critique_rounds}
 
-            try:
-                critique, _ = yield from self._stream_director(current_script)
-            except Exception as exc:
-                yield {"type": "error", "text": f"Director error (round {n}): {exc}"}
-                return
+            # Use the speculative critique only when its snapshot covered
+            # nearly the whole final draft; a critique of a materially shorter
+            # draft would review lines that no longer exist.
+            critique = None
+            if (
+                n == 1
+                and spec_thread is not None
+                and spec_words >= _SPEC_MIN_COVERAGE * len(current_script.split())
+            ):
+                spec_thread.join()
+                critique = spec.get("critique")
+                if critique:
+                    yield {"type": "director_chunk", "text": critique}
+
+            if critique is None:
+                try:
+                    critique, _ = yield from self._stream_director(current_script)
+                except Exception as exc:
+                    yield {"type": "error", "text": f"Director error (round {n}): {exc}"}
+                    return
 
             yield {"type": "director_done", "round": n, "critique": critique}
             yield {"type": "revision_start", "round": n}
@@ -142,50 +314,116 @@ class FunnyPlayDirectorLoop:
 
     # ── Private helpers ───────────────────────────────────────────────────────
 
-    def _stream_director(self, script: str) -> Generator[dict, None, tuple]:
-        """Stream a director critique. Yields director_chunk events. Returns (text, stop_reason)."""
-        system = PromptRegistry.get("funny_play_director_system", language=self.language)
-        user_message = PromptRegistry.get("funny_play_director_critique", script=script)
-
-        full_text = ""
-        stop_reason = "end_turn"
-        with self._client.messages.stream(
+    def _critique_once(self, script: str) -> str:
+        """Non-streaming director critique — used by the speculative round-1
+        path, where the text is emitted as a single director_chunk event."""
+        system = _cached_prompt("funny_play_director_system", self.language)
+        instruction = _cached_prompt("funny_play_director_critique")
+        response = self._client.messages.create(
             model=MODEL,
             max_tokens=1024,
-            system=system,
-            messages=[{"role": "user", "content": user_message}],
-        ) as stream:
-            for text in stream.text_stream:
-                full_text += text
-                yield {"type": "director_chunk", "text": text}
-            stop_reason = stream.get_final_message().stop_reason
+            system=_system_blocks(system),
+            messages=_script_then_instruction(f"SCRIPT:\n{script}", instruction),
+            extra_headers=_CACHE_HEADERS,
+        )
+        return response.content[0].text
 
-        return full_text, stop_reason
+    def _stream_director(self, script: str) -> Generator[dict, None, tuple]:
+        """Stream a director critique. Yields director_chunk events. Returns (text, stop_reason)."""
+        system = _cached_prompt("funny_play_director_system", self.language)
+        instruction = _cached_prompt("funny_play_director_critique")
+
+        return (yield from self._stream_events(
+            "director_chunk",
+            dict(
+                model=MODEL,
+                max_tokens=1024,
+                system=_system_blocks(system),
+                messages=_script_then_instruction(f"SCRIPT:\n{script}", instruction),
+                extra_headers=_CACHE_HEADERS,
+            ),
+        ))
 
     def _stream_revision(self, script: str, critique: str) -> Generator[dict, None, tuple]:
         """Stream a playwright revision. Yields revision_chunk events. Returns (text, stop_reason)."""
-        system = PromptRegistry.get("funny_play_system", language=self.language)
-        user_message = PromptRegistry.get(
+        system = _cached_prompt("funny_play_system", self.language)
+        instruction = PromptRegistry.get(
             "funny_play_revise",
             critique=critique,
-            script=script,
             language=self.language,
         )
 
-        full_text = ""
+        return (yield from self._stream_events(
+            "revision_chunk",
+            dict(
+                model=MODEL,
+                max_tokens=MAX_TOKENS,
+                system=_system_blocks(system),
+                messages=_script_then_instruction(f"ORIGINAL SCRIPT:\n{script}", instruction),
+                extra_headers=_CACHE_HEADERS,
+            ),
+        ))
+
+    def _stream_events(self, event_type: str, call_kwargs: dict) -> Generator[dict, None, tuple]:
+        """
+        Make one streaming call, yielding one `event_type` event per fragment.
+        Returns (full_text, stop_reason).
+
+        With ``parallel=True`` the SDK stream is drained on a background pump
+        thread into a queue, so the download proceeds at network speed even
+        while the frontend is still rendering earlier fragments — the next
+        round's request can then fire as soon as the model finishes, not after
+        the last chunk is painted.  With ``parallel=False`` the stream is
+        consumed inline on the calling thread.
+        """
+        if self.parallel:
+            return (yield from self._stream_events_pumped(event_type, call_kwargs))
+
+        parts: list = []
         stop_reason = "end_turn"
-        with self._client.messages.stream(
-            model=MODEL,
-            max_tokens=MAX_TOKENS,
-            system=system,
-            messages=[{"role": "user", "content": user_message}],
-        ) as stream:
-            for text in stream.text_stream:
-                full_text += text
-                yield {"type": "revision_chunk", "text": text}
+        with self._client.messages.stream(**call_kwargs) as stream:
+            for text in _coalesced(stream.text_stream, self.batch_chars, self.batch_ms / 1000.0):
+                parts.append(text)
+                yield {"type": event_type, "text": text}
             stop_reason = stream.get_final_message().stop_reason
 
-        return full_text, stop_reason
+        return "".join(parts), stop_reason
+
+    def _stream_events_pumped(self, event_type: str, call_kwargs: dict) -> Generator[dict, None, tuple]:
+        """Queue-backed variant of `_stream_events` — see there for semantics."""
+        events: queue.Queue = queue.Queue()
+
+        def _pump() -> None:
+            try:
+                parts = []
+                with self._client.messages.stream(**call_kwargs) as stream:
+                    for text in stream.text_stream:
+                        parts.append(text)
+                        events.put(("text", text))
+                    stop_reason = stream.get_final_message().stop_reason
+                events.put(("done", ("".join(parts), stop_reason)))
+            except Exception as exc:  # surfaced on the consumer thread
+                events.put(("error", exc))
+
+        threading.Thread(target=_pump, daemon=True).start()
+
+        result: list = []
+
+        def _drain() -> Generator[str, None, None]:
+            while True:
+                kind, payload = events.get()
+                if kind == "text":
+                    yield payload
+                elif kind == "error":
+                    raise payload
+                else:  # done
+                    result.append(payload)
+                    return
+
+        for text in _coalesced(_drain(), self.batch_chars, self.batch_ms / 1000.0):
+            yield {"type": event_type, "text": text}
+
+        return result[0]
 
 
 def rewrite_as_comedian_monologue(script_text: str, language: str = "English") -> str:
@@ -196,8 +434,7 @@ def rewrite_as_comedian_monologue(script_text: str, language: str = "English") -
     natural character-switch phrasing and comedic connective tissue already
     baked in.  Feed this directly to TTS.
     """
-    client = anthropic.Anthropic(api_key=os.environ["ANTHROPIC_API_KEY"])
-    response = client.messages.create(
+    response = _get_client().messages.create(
         model=MODEL,
         max_tokens=1024,
         system=_MONOLOGUE_SYSTEM.format(language=language),
@@ -225,11 +462,20 @@ class FunnyPlayGenerator:
         gen.save_script("funny_play.txt")
     """
 
-    def __init__(self, theme: str, language: str = "English"):
+    def __init__(
+        self,
+        theme: str,
+        language: str = "English",
+        batch_chars: int = BATCH_CHARS,
+        batch_ms: int = BATCH_MS,
+    ):
         self.theme = theme
         self.language = language
+        # Chunk-coalescing knobs — see BATCH_CHARS / BATCH_MS above.
+        self.batch_chars = batch_chars
+        self.batch_ms = batch_ms
         self.final_script: str = ""
-        self._client = anthropic.Anthropic(api_key=os.environ["ANTHROPIC_API_KEY"])
+        self._client = _get_client()
 
     # ── Public API ────────────────────────────────────────────────────────────
 
@@ -243,7 +489,7 @@ class FunnyPlayGenerator:
           {"type": "warning", "text": str}   — continuation notice
           {"type": "error",   "text": str}   — fatal error
         """
-        system = PromptRegistry.get("funny_play_system", language=self.language)
+        system = _cached_prompt("funny_play_system", self.language)
         user_message = PromptRegistry.get(
             "funny_play_generate", theme=self.theme, language=self.language
         )
@@ -274,14 +520,16 @@ class FunnyPlayGenerator:
     ) -> Generator[dict, None, str]:
         """Stream with automatic continuation when the model hits the token limit."""
         messages = [{"role": "user", "content": user_message}]
-        accumulated = ""
+        # Accumulate response pieces in a list and join on demand — repeated
+        # str += is quadratic once the string is also referenced elsewhere.
+        chunks: list = []
 
         for attempt in range(MAX_CONTINUATIONS + 1):
             chunk, stop_reason = yield from self._stream_call(
                 system=system,
                 messages=messages,
             )
-            accumulated += chunk
+            chunks.append(chunk)
 
             if stop_reason != "max_tokens":
                 break
@@ -296,7 +544,7 @@ class FunnyPlayGenerator:
 
             # Feed partial response back and ask to continue
             messages = messages + [
-                {"role": "assistant", "content": accumulated},
+                {"role": "assistant", "content": "".join(chunks)},
                 {
                     "role": "user",
                     "content": (
@@ -311,7 +559,7 @@ class FunnyPlayGenerator:
                 "text": f"Play is long — fetching continuation {attempt + 1} of {MAX_CONTINUATIONS}…",
             }
 
-        return accumulated
+        return "".join(chunks)
 
     def _stream_call(
         self,
@@ -319,16 +567,17 @@ class FunnyPlayGenerator:
         messages: list,
     ) -> Generator[dict, None, tuple]:
         """Make one streaming API call, yielding chunk events. Returns (text, stop_reason)."""
-        full_text = ""
+        parts: list = []
         with self._client.messages.stream(
             model=MODEL,
             max_tokens=MAX_TOKENS,
-            system=system,
+            system=_system_blocks(system),
             messages=messages,
+            extra_headers=_CACHE_HEADERS,
         ) as stream:
-            for text in stream.text_stream:
-                full_text += text
+            for text in _coalesced(stream.text_stream, self.batch_chars, self.batch_ms / 1000.0):
+                parts.append(text)
                 yield {"type": "chunk", "text": text}
             stop_reason = stream.get_final_message().stop_reason
 
-        return full_text, stop_reason
+        return "".join(parts), stop_reason
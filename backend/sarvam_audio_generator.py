@@ -16,17 +16,23 @@ Long segments are split at sentence boundaries and the resulting WAV chunks
 are concatenated before silence is appended.
 """
 
+import atexit
 import base64
+import hashlib
 import io
 import os
 import re
-import struct
+import time
 import wave
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from itertools import cycle
-from typing import Dict, Generator, List
+from tempfile import SpooledTemporaryFile
+from typing import Dict, Generator, List, Optional
 
-import requests
+import httpx
 
+from backend import tts_cache
 from backend.script_parser import ScriptSegment
 
 # ── API constants ──────────────────────────────────────────────────────────────
@@ -69,16 +75,71 @@ SPEAKERS: Dict[str, str] = {
 
 NARRATOR_DEFAULT = "kabir"
 
-# Character auto-assignment pool — alternating F/M for natural variety
-_CHARACTER_POOL = [
+# Character auto-assignment pool — alternating F/M for natural variety.
+# A tuple: the pool is a constant, and hashable inputs let _pool_for memoise.
+_CHARACTER_POOL = (
     "priya", "aditya", "neha", "rahul", "simran", "dev",
     "pooja", "varun",  "kavya", "rohan",
-]
+)
+
+
+@lru_cache(maxsize=64)
+def _pool_for(narrator_voice: str) -> tuple:
+    """Character pool with the narrator's voice filtered out, computed once
+    per narrator instead of per generator instance."""
+    return tuple(v for v in _CHARACTER_POOL if v != narrator_voice)
 
 # Silence durations (ms)
 _SILENCE_DIALOGUE_MS = 300
 _SILENCE_HEADING_MS  = 800
 
+# How many TTS requests may be in flight at once.  Each Sarvam call is an
+# independent 1–3 s round-trip, so overlapping them collapses total wall time
+# to roughly max(latency) x ceil(segments / concurrency).
+_MAX_CONCURRENT_TTS = 8
+
+# Preferred output codec.  linear16 returns headerless PCM — no RIFF
+# container to base64-decode, parse, and strip per chunk.  Not every Sarvam
+# deployment accepts it, so the first rejection downgrades the whole process
+# to "wav" and the RIFF payload is sliced out instead.
+_CODEC = {"value": "linear16"}
+
+# Statuses that mean the request body itself was refused — the only ones
+# that justify downgrading the codec.  Anything else (auth, rate limit,
+# gateway) would fail under "wav" just the same.
+_CODEC_REJECT_STATUSES = frozenset({400, 422})
+
+# Gateway statuses retried (with backoff) before a call is failed.
+_RETRY_STATUSES = frozenset({502, 503, 504})
+
+# Constant portion of every TTS request body; per-call fields (text, speaker,
+# language, codec, prosody overrides) are merged on top instead of rebuilding
+# the whole literal for each request.
+_BASE_BODY = {
+    "model": _MODEL,
+    "speech_sample_rate": _SAMPLE_RATE,
+    "enable_preprocessing": True,
+}
+
+
+def _make_http_client() -> httpx.Client:
+    """Build the pooled transport shared by all Sarvam TTS calls.
+
+    One keep-alive pool sized for the thread pool above replaces a TCP+TLS
+    handshake per chunk; with the optional `h2` extra installed the many
+    small concurrent requests multiplex over a few HTTP/2 connections.
+    """
+    limits = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+    try:
+        return httpx.Client(http2=True, timeout=30.0, limits=limits)
+    except ImportError:
+        # h2 not installed — HTTP/1.1 with keep-alive is still pooled.
+        return httpx.Client(timeout=30.0, limits=limits)
+
+
+_HTTP = _make_http_client()
+atexit.register(_HTTP.close)
+
 
 class SarvamAudioGenerator:
     """
@@ -102,57 +163,110 @@ class SarvamAudioGenerator:
         self._lang_code = LANGUAGE_CODES.get(language, "en-IN")
         self._narrator_voice = narrator_voice
         self._character_voice_map: Dict[str, str] = {}
-        self._voice_pool = cycle(
-            [v for v in _CHARACTER_POOL if v != narrator_voice]
-        )
+        self._voice_pool = cycle(_pool_for(narrator_voice))
 
     # ── Public API ────────────────────────────────────────────────────────────
 
     def generate_audio_play(
-        self, segments: List[ScriptSegment]
+        self, segments: List[ScriptSegment], out_path: Optional[str] = None
     ) -> Generator[dict, None, None]:
         """
         Yield progress events then a final audio_done event.
 
+        Segments are written to the output WAV as soon as they (and all their
+        predecessors) are synthesised, so peak memory is bounded by the few
+        out-of-order results in flight rather than a list of every PCM chunk.
+        With the default ``out_path=None`` the WAV is assembled in a spooled
+        temp file and returned as bytes; pass a path to stream it to disk, in
+        which case audio_done carries ``path`` and ``wav_bytes`` is None.
+
         Yielded shapes (identical to AudioGenerator):
           {"type": "audio_progress", "current": int, "total": int, "speaker": str}
-          {"type": "audio_done",     "wav_bytes": bytes, "voice_map": dict}
+          {"type": "audio_done",     "wav_bytes": bytes | None, "path": str | None,
+                                     "voice_map": dict}
           {"type": "audio_error",    "text": str}
         """
         total = len(segments)
-        all_frames: List[bytes] = []
-
-        for idx, segment in enumerate(segments, start=1):
-            yield {
-                "type": "audio_progress",
-                "current": idx,
-                "total": total,
-                "speaker": segment.speaker,
-            }
 
-            voice = self._get_voice(segment)
-
-            try:
-                frames = self._synthesise_segment(segment.text, voice)
-            except Exception as exc:
-                yield {"type": "audio_error", "text": f"Sarvam TTS error on segment {idx}: {exc}"}
-                return
-
-            all_frames.extend(frames)
-
-            silence_ms = (
-                _SILENCE_HEADING_MS
-                if segment.segment_type == "heading"
-                else _SILENCE_DIALOGUE_MS
-            )
-            all_frames.append(
-                _make_silence(silence_ms, _SAMPLE_RATE, _N_CHANNELS, _SAMPWIDTH)
-            )
+        # Assign every voice up front in one pass in script order.  Voice
+        # choice depends on order of first appearance, so doing it before
+        # dispatch keeps the mapping deterministic no matter which concurrent
+        # request completes first.
+        voices = [self._get_voice(segment) for segment in segments]
+
+        sink = open(out_path, "wb") if out_path else SpooledTemporaryFile(max_size=8 << 20)
+        wf = wave.open(sink, "wb")
+        wf.setnchannels(_N_CHANNELS)
+        wf.setsampwidth(_SAMPWIDTH)
+        wf.setframerate(_SAMPLE_RATE)
+
+        # Completed segments not yet written (finished out of order).
+        pending: Dict[int, List[bytes]] = {}
+        next_to_write = 0
+
+        def _write_ready() -> None:
+            """Flush every segment whose predecessors are already written."""
+            nonlocal next_to_write
+            while next_to_write in pending:
+                for frames in pending.pop(next_to_write):
+                    wf.writeframesraw(frames)
+                silence_ms = (
+                    _SILENCE_HEADING_MS
+                    if segments[next_to_write].segment_type == "heading"
+                    else _SILENCE_DIALOGUE_MS
+                )
+                wf.writeframesraw(
+                    _make_silence(silence_ms, _SAMPLE_RATE, _N_CHANNELS, _SAMPWIDTH)
+                )
+                next_to_write += 1
+
+        finished = False
+        try:
+            with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_TTS) as pool:
+                futures = {
+                    pool.submit(self._synthesise_segment, segment.text, voices[idx]): idx
+                    for idx, segment in enumerate(segments)
+                }
+                for done, future in enumerate(as_completed(futures), start=1):
+                    idx = futures[future]
+                    try:
+                        pending[idx] = future.result()
+                    except Exception as exc:
+                        yield {"type": "audio_error", "text": f"Sarvam TTS error on segment {idx + 1}: {exc}"}
+                        return
+                    _write_ready()
+                    yield {
+                        "type": "audio_progress",
+                        "current": done,
+                        "total": total,
+                        "speaker": segments[idx].speaker,
+                    }
+
+            wf.close()  # patches the RIFF header with the final frame count
+            if out_path:
+                wav_bytes = None
+            else:
+                sink.seek(0)
+                wav_bytes = sink.read()
+            finished = True
+        finally:
+            # Close wf before sink; wave's close() is a no-op if the success
+            # path already ran it, and on the error path it must patch the
+            # header while the underlying file is still open — otherwise the
+            # eventual Wave_write.__del__ writes to a closed file.
+            wf.close()
+            sink.close()
+            if not finished and out_path:
+                # Don't leave a truncated WAV behind on failure.
+                try:
+                    os.remove(out_path)
+                except OSError:
+                    pass
 
-        combined = _combine_frames(all_frames, _SAMPLE_RATE, _N_CHANNELS, _SAMPWIDTH)
         yield {
             "type": "audio_done",
-            "wav_bytes": combined,
+            "wav_bytes": wav_bytes,
+            "path": out_path,
             "voice_map": dict(self._character_voice_map),
         }
 
@@ -172,52 +286,100 @@ class SarvamAudioGenerator:
         """
         frames = []
         for chunk in _chunk_text(text, _MAX_CHARS):
-            wav_bytes = self._api_call(chunk, voice)
-            frames.extend(_extract_frames(wav_bytes))
+            frames.extend(_synth_pcm(self._api_key, chunk, voice, self._lang_code))
         return frames
 
-    def _api_call(self, text: str, speaker: str) -> bytes:
-        """POST to Sarvam TTS, return raw WAV bytes."""
-        response = requests.post(
-            _API_URL,
-            headers={
-                "api-subscription-key": self._api_key,
-                "Content-Type": "application/json",
-            },
-            json={
-                "text": text,
-                "target_language_code": self._lang_code,
-                "speaker": speaker,
-                "model": _MODEL,
-                "output_audio_codec": "wav",
-                "speech_sample_rate": _SAMPLE_RATE,
-                "enable_preprocessing": True,
-            },
-            timeout=30,
-        )
+
+def _synth_pcm(api_key: str, text: str, speaker: str, lang_code: str, **extra) -> List[bytes]:
+    """
+    POST one TTS request and return its raw PCM frame chunks.
+
+    Asks for the preferred codec first (headerless linear16); if the service
+    rejects the request body (400/422), the process downgrades to "wav" for
+    all subsequent calls and the payload is sliced out of the RIFF container
+    instead.  Other failures (auth, rate limit, gateway) are raised as-is —
+    they are not codec problems and retrying under "wav" would only double
+    the traffic.  *extra* carries per-call prosody overrides such as
+    pace/temperature.
+
+    Results are served from the on-disk cache when an identical
+    (speaker, language, prosody, text) combination was synthesised before —
+    the common case when a revision loop changes only a few lines.
+    """
+    cache_key = hashlib.blake2b(
+        f"{speaker}|{lang_code}|{sorted(extra.items())}|{text}".encode(),
+        digest_size=16,
+    ).hexdigest()
+    cached = tts_cache.get(cache_key)
+    if cached is not None:
+        return [cached]
+
+    codec = _CODEC["value"]
+    codecs = (codec,) if codec == "wav" else (codec, "wav")
+    for codec in codecs:
+        body = {
+            **_BASE_BODY,
+            "text": text,
+            "target_language_code": lang_code,
+            "speaker": speaker,
+            "output_audio_codec": codec,
+            **extra,
+        }
+        for attempt in range(3):
+            response = _HTTP.post(
+                _API_URL,
+                headers={"api-subscription-key": api_key},
+                json=body,
+            )
+            if response.status_code in _RETRY_STATUSES and attempt < 2:
+                time.sleep(0.3 * (2 ** attempt))
+                continue
+            break
         if response.status_code != 200:
+            if codec != "wav" and response.status_code in _CODEC_REJECT_STATUSES:
+                _CODEC["value"] = "wav"
+                continue
             raise RuntimeError(
                 f"Sarvam API error {response.status_code}: {response.text[:200]}"
             )
         audios = response.json().get("audios", [])
         if not audios:
             raise RuntimeError("Sarvam API returned no audio data.")
-        return base64.b64decode(audios[0])
+        raw = base64.b64decode(audios[0])
+        # Some codecs may still hand back a RIFF container — detect and strip.
+        pcm = b"".join(_extract_frames(raw)) if raw[:4] == b"RIFF" else raw
+        tts_cache.put(cache_key, pcm)
+        return [pcm]
+    raise RuntimeError("Sarvam API rejected every supported output codec.")
 
 
 # ── WAV utilities (module-level, shared with the stitching logic) ─────────────
 
+# Sentence-ending punctuation (Latin + Devanagari danda), compiled once at
+# import instead of per _chunk_text call.
+_SENT_BOUNDARY = re.compile(r"(?<=[.!?।])\s+")
+
+
+def _iter_sentences(text: str) -> Generator[str, None, None]:
+    """Yield sentences lazily by walking boundary matches — no list of every
+    substring is materialised just to be re-joined under the budget."""
+    start = 0
+    for match in _SENT_BOUNDARY.finditer(text):
+        yield text[start : match.start()]
+        start = match.end()
+    if start < len(text):
+        yield text[start:]
+
+
 def _chunk_text(text: str, max_chars: int) -> List[str]:
     """Split *text* into chunks under *max_chars* at sentence boundaries."""
     if len(text) <= max_chars:
         return [text]
 
-    # Split at sentence-ending punctuation (Latin + Devanagari danda)
-    sentences = re.split(r"(?<=[.!?।])\s+", text)
     chunks: List[str] = []
     current = ""
 
-    for sentence in sentences:
+    for sentence in _iter_sentences(text):
         if len(current) + len(sentence) + 1 <= max_chars:
             current = (current + " " + sentence).strip()
         else:
@@ -238,6 +400,20 @@ def _chunk_text(text: str, max_chars: int) -> List[str]:
 
 
 def _extract_frames(wav_bytes: bytes) -> List[bytes]:
+    """
+    Slice the PCM payload out of a Sarvam WAV response.
+
+    The API returns a known-shape RIFF container (24 kHz mono s16le), so the
+    frames can be sliced straight after the "data" chunk header without
+    constructing a wave reader per response.  Falls back to a full RIFF parse
+    if the marker is missing or the declared size looks wrong.
+    """
+    i = wav_bytes.find(b"data")
+    if i != -1 and len(wav_bytes) >= i + 8:
+        size = int.from_bytes(wav_bytes[i + 4 : i + 8], "little")
+        payload = wav_bytes[i + 8 : i + 8 + size]
+        if len(payload) == size:
+            return [payload]
     with wave.open(io.BytesIO(wav_bytes), "rb") as wf:
         return [wf.readframes(wf.getnframes())]
 
@@ -245,8 +421,10 @@ def _extract_frames(wav_bytes: bytes) -> List[bytes]:
 def _make_silence(
     duration_ms: int, sample_rate: int, n_channels: int, sampwidth: int
 ) -> bytes:
+    # Silence in signed PCM is all-zero bytes — no need to materialise a list
+    # of sample ints and pack them one by one.
     n_samples = int(sample_rate * duration_ms / 1000) * n_channels
-    return struct.pack(f"<{n_samples}h", *([0] * n_samples))
+    return b"\x00" * (n_samples * sampwidth)
 
 
 def _combine_frames(
@@ -282,47 +460,28 @@ def generate_comedian_audio(
     lang_code = LANGUAGE_CODES.get(language, "en-IN")
     chunks = _chunk_text(text, _MAX_CHARS)
     total = len(chunks)
-    all_frames: List[bytes] = []
 
-    for i, chunk in enumerate(chunks, 1):
-        yield {"type": "audio_progress", "current": i, "total": total, "speaker": "COMEDIAN"}
-        try:
-            response = requests.post(
-                _API_URL,
-                headers={
-                    "api-subscription-key": api_key,
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "text": chunk,
-                    "target_language_code": lang_code,
-                    "speaker": voice,
-                    "model": _MODEL,
-                    "output_audio_codec": "wav",
-                    "speech_sample_rate": _SAMPLE_RATE,
-                    "enable_preprocessing": True,
-                    "pace": 0.9,
-                    "temperature": 0.85,
-                },
-                timeout=30,
-            )
-        except Exception as exc:
-            yield {"type": "audio_error", "text": f"Sarvam TTS error: {exc}"}
-            return
+    def _synth_chunk(chunk: str) -> List[bytes]:
+        return _synth_pcm(api_key, chunk, voice, lang_code, pace=0.9, temperature=0.85)
 
-        if response.status_code != 200:
-            yield {
-                "type": "audio_error",
-                "text": f"Sarvam API error {response.status_code}: {response.text[:200]}",
-            }
-            return
+    # Chunks are independent — synthesise them concurrently and reassemble
+    # in original order from per-chunk slots.
+    frames_by_idx: List[Optional[List[bytes]]] = [None] * total
 
-        audios = response.json().get("audios", [])
-        if not audios:
-            yield {"type": "audio_error", "text": "Sarvam API returned no audio data."}
-            return
+    with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_TTS) as pool:
+        futures = {pool.submit(_synth_chunk, chunk): i for i, chunk in enumerate(chunks)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            i = futures[future]
+            try:
+                frames_by_idx[i] = future.result()
+            except Exception as exc:
+                yield {"type": "audio_error", "text": f"Sarvam TTS error: {exc}"}
+                return
+            yield {"type": "audio_progress", "current": done, "total": total, "speaker": "COMEDIAN"}
 
-        all_frames.extend(_extract_frames(base64.b64decode(audios[0])))
+    all_frames: List[bytes] = []
+    for frames in frames_by_idx:
+        all_frames.extend(frames)
 
     combined = _combine_frames(all_frames, _SAMPLE_RATE, _N_CHANNELS, _SAMPWIDTH)
     yield {"type": "audio_done", "wav_bytes": combined, "voice_map": {"COMEDIAN": voice}}
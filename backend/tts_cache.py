@@ -0,0 +1,77 @@
+"""
+Content-addressed on-disk cache for synthesised TTS audio.
+
+Director-revision loops usually change only a few lines of a script, yet every
+regeneration used to re-synthesise all segments end-to-end.  Callers hash
+(voice, language, text) into a key; identical segments are then served from
+disk instead of a fresh API round-trip.
+
+Layout: one raw-PCM file per key under .cache/tts/ (override the location via
+the TTS_CACHE_DIR environment variable).  Eviction is LRU by file mtime — a
+hit refreshes the mtime — with the directory capped at _MAX_CACHE_BYTES.
+All operations are best-effort: any filesystem error degrades to a miss.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+_CACHE_DIR = Path(os.environ.get("TTS_CACHE_DIR", ".cache/tts"))
+
+# Size cap for the cache directory.  ~1 MB buys around 20 s of 24 kHz s16le
+# mono audio, so 256 MB holds roughly 85 minutes of distinct segments.
+_MAX_CACHE_BYTES = 256 << 20
+
+# Serialises eviction scans; get/put themselves are atomic at the file level.
+_EVICT_LOCK = threading.Lock()
+
+
+def get(key: str) -> Optional[bytes]:
+    """Return the cached PCM for *key*, or None on a miss."""
+    path = _CACHE_DIR / f"{key}.pcm"
+    try:
+        pcm = path.read_bytes()
+    except OSError:
+        return None
+    try:
+        os.utime(path)  # refresh mtime so LRU eviction keeps hot entries
+    except OSError:
+        pass
+    return pcm
+
+
+def put(key: str, pcm: bytes) -> None:
+    """Store *pcm* under *key*, then evict least-recently-used overflow."""
+    path = _CACHE_DIR / f"{key}.pcm"
+    tmp = _CACHE_DIR / f"{key}.tmp"
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(pcm)
+        tmp.replace(path)  # atomic rename — readers never see a torn file
+    except OSError:
+        return
+    _evict()
+
+
+def _evict() -> None:
+    """Delete oldest entries until the directory is back under the size cap."""
+    with _EVICT_LOCK:
+        try:
+            entries = [
+                (p.stat().st_mtime, p.stat().st_size, p)
+                for p in _CACHE_DIR.glob("*.pcm")
+            ]
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        if total <= _MAX_CACHE_BYTES:
+            return
+        for _, size, path in sorted(entries):
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            if total <= _MAX_CACHE_BYTES:
+                break
@@ -10,16 +10,69 @@ Audio section supports two TTS providers:
   • Sarvam AI   — 30+ voices (bulbul:v3), ideal for English / Hindi / Bengali
 """
 
+import io
 import sys
 import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from types import SimpleNamespace
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+import pandas as pd
 import streamlit as st
 from dotenv import load_dotenv
 
 load_dotenv()
 
+
+@st.cache_resource
+def _backends() -> SimpleNamespace:
+    """
+    Import every backend entry point once per server process.
+
+    Streamlit re-executes this whole script on each widget interaction, so the
+    old inline `from backend... import ...` statements re-ran the import
+    machinery (and, on first touch, the heavy anthropic/openai/httpx SDK
+    imports) on every rerun.  A cache_resource factory pays that cost once and
+    hands the same namespace back to all sessions.
+    """
+    from backend.agents import PlayWritingSession
+    from backend.audio_generator import (
+        AudioGenerator,
+        generate_comedian_audio as generate_comedian_audio_openai,
+    )
+    from backend.funny_play_generator import (
+        FunnyPlayDirectorLoop,
+        FunnyPlayGenerator,
+        rewrite_as_comedian_monologue,
+    )
+    from backend.sarvam_audio_generator import (
+        LANGUAGE_CODES,
+        NARRATOR_DEFAULT,
+        SPEAKERS,
+        SarvamAudioGenerator,
+        generate_comedian_audio as generate_comedian_audio_sarvam,
+    )
+    from backend.script_parser import build_comedian_script, parse_script
+
+    return SimpleNamespace(
+        PlayWritingSession=PlayWritingSession,
+        AudioGenerator=AudioGenerator,
+        generate_comedian_audio_openai=generate_comedian_audio_openai,
+        FunnyPlayDirectorLoop=FunnyPlayDirectorLoop,
+        FunnyPlayGenerator=FunnyPlayGenerator,
+        rewrite_as_comedian_monologue=rewrite_as_comedian_monologue,
+        LANGUAGE_CODES=LANGUAGE_CODES,
+        NARRATOR_DEFAULT=NARRATOR_DEFAULT,
+        SPEAKERS=SPEAKERS,
+        SarvamAudioGenerator=SarvamAudioGenerator,
+        generate_comedian_audio_sarvam=generate_comedian_audio_sarvam,
+        build_comedian_script=build_comedian_script,
+        parse_script=parse_script,
+    )
+
 # ── Page config ───────────────────────────────────────────────────────────────
 st.set_page_config(
     page_title="Play Writer AI",
@@ -37,8 +90,156 @@ st.caption(
 # ── Shared helpers ────────────────────────────────────────────────────────────
 
 _OPENAI_COMEDIAN_VOICES = ["alloy", "echo", "fable", "onyx", "nova", "shimmer"]
+_OPENAI_COMEDIAN_DEFAULT_INDEX = _OPENAI_COMEDIAN_VOICES.index("onyx")
+
+
+class _FlushGate:
+    """
+    Decide when a streaming text buffer is worth re-rendering.
+
+    Every `*_chunk` event used to call `box.markdown(buf + "▌")`, which ships
+    the entire growing buffer over the websocket each time — O(N²) bytes for
+    an N-char script.  Rendering only when ~256 new chars have arrived or
+    50 ms have passed (mirroring the backend coalescing thresholds) caps the
+    re-render rate without visible lag; the `*_done` handlers still do an
+    unconditional final flush.
+    """
+
+    def __init__(self, chars: int = 256, seconds: float = 0.05) -> None:
+        self._chars = chars
+        self._seconds = seconds
+        self._pending = 0
+        self._last_flush = 0.0
+
+    def ready(self, n_new_chars: int) -> bool:
+        """Record *n_new_chars* arrivals; True if the buffer should re-render now."""
+        self._pending += n_new_chars
+        now = time.monotonic()
+        if self._pending >= self._chars or now - self._last_flush >= self._seconds:
+            self._pending = 0
+            self._last_flush = now
+            return True
+        return False
+
+
+# Single worker for script saves: writes are rare and tiny, and one thread
+# keeps them ordered if a user regenerates before the previous save lands.
+_SAVE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="script-save")
+
+
+def _save_script_async(saver, filename: str) -> Future:
+    """
+    Start a backend save_script callable on a worker thread.
+
+    The write used to run synchronously between two UI updates, so a slow
+    disk stalled the final success render.  Callers draw the rest of the
+    result UI while the write overlaps, then resolve the returned future
+    with _report_save so "saved" is only claimed once the write landed.
+    """
+    return _SAVE_POOL.submit(saver, filename)
 
 
+def _report_save(future: Future, filename: str) -> None:
+    """Render the outcome of a pending script save."""
+    try:
+        future.result(timeout=5.0)
+    except FutureTimeoutError:
+        st.info(f"Still saving **{filename}** in the background…")
+    except Exception as exc:
+        st.error(f"Could not save {filename}: {exc}")
+    else:
+        st.success(f"Script saved to **{filename}**")
+
+
+def _audio_buffer(audio_key: str) -> io.BytesIO:
+    """
+    Reusable BytesIO over the cached WAV for *audio_key*.
+
+    st.audio and st.download_button were handed the raw bytes from
+    session_state on every rerun, pushing the full multi-MB WAV back through
+    Streamlit's serializer each interaction.  Handing back the same buffer
+    object lets the media manager recognise it and skip the re-upload.
+    """
+    buf_key = f"{audio_key}_buf"
+    buf = st.session_state.get(buf_key)
+    if buf is None:
+        buf = io.BytesIO(st.session_state[audio_key])
+        st.session_state[buf_key] = buf
+    return buf
+
+
+def _render_audio_and_download(audio_key: str, filename: str, key_suffix: str) -> None:
+    """
+    Shared audio player + download button over the cached WAV for *audio_key*.
+
+    The same st.audio/st.download_button pair appeared at four call sites;
+    fetching the BytesIO once here means the WAV is hashed a single time per
+    render instead of once per widget per site.
+    """
+    buf = _audio_buffer(audio_key)
+    st.audio(buf, format="audio/wav")
+    st.download_button(
+        label="⬇️ Download Audio (WAV)",
+        data=buf,
+        file_name=filename,
+        mime="audio/wav",
+        key=f"dl_{key_suffix}",
+    )
+
+
+@st.cache_data
+def _sarvam_voice_options() -> tuple:
+    """
+    Build the labelled Sarvam voice list once: "Kabir (♂)", "Priya (♀)", …
+
+    Returns (sorted_labels, label→speaker_name map).  SPEAKERS is static, but
+    every rerun used to re-format and re-sort all 30+ entries and then undo
+    the formatting with `choice.split(" (")[0].lower()` — the reverse map makes
+    the lookup a dict hit instead.
+    """
+    speakers = _backends().SPEAKERS
+    name_by_label = {
+        f"{name.title()} ({'♂' if g == 'M' else '♀'})": name
+        for name, g in speakers.items()
+    }
+    return sorted(name_by_label), name_by_label
+
+
+@st.cache_data
+def _sarvam_narrator_default() -> tuple:
+    """
+    (default_label, default_idx) for the narrator selectbox.
+
+    Derived from NARRATOR_DEFAULT once instead of re-formatting the label and
+    linearly scanning the option list on every rerun of the audio section.
+    """
+    b = _backends()
+    voice_options, _ = _sarvam_voice_options()
+    gender = b.SPEAKERS.get(b.NARRATOR_DEFAULT, "M")
+    label = f"{b.NARRATOR_DEFAULT.title()} ({'♂' if gender == 'M' else '♀'})"
+    idx = voice_options.index(label) if label in voice_options else 0
+    return label, idx
+
+
+@st.cache_data(max_entries=8)
+def _cached_parse_script(text: str) -> list:
+    """
+    Parse *text* once per distinct script.
+
+    Parsing is pure, and the same script is parsed for the comedian flatten,
+    the TTS pipeline, and again after every provider toggle + regenerate.
+    cache_data keys on the text content, so those all share one parse.
+    """
+    return _backends().parse_script(text)
+
+
+@st.cache_data(max_entries=8)
+def _cached_build_comedian_script(text: str) -> str:
+    """Flattened one-voice monologue for *text*, cached alongside the parse."""
+    return _backends().build_comedian_script(_cached_parse_script(text))
+
+
+@st.fragment
 def render_comedian_audio_section(
     script_key: str,
     audio_key: str,
@@ -51,201 +252,254 @@ def render_comedian_audio_section(
     A single comedian voice performs the entire play — no narrator/character split.
     Stage directions and dialogue are flattened into one continuous monologue and
     sent to TTS as one unified performance.
+
+    Runs as a fragment: provider/voice widget changes rerun only this section,
+    not the whole script (all cross-rerun state lives in st.session_state).
     """
     st.divider()
-    st.subheader("🎤 Comedian Audio")
-    st.caption(
-        "One voice performs the entire play — stage directions become natural asides, "
-        "character lines are performed directly. No narrator switching."
-    )
-
-    language = st.session_state.get(language_key, "English")
+    # Collapsed by default: the player, table, and download widgets inside
+    # are only built once the user opens the panel.
+    with st.expander("🎤 Comedian Audio", expanded=False):
+        st.caption(
+            "One voice performs the entire play — stage directions become natural asides, "
+            "character lines are performed directly. No narrator switching."
+        )
 
-    provider = st.radio(
-        "TTS Provider",
-        ["OpenAI TTS", "Sarvam AI"],
-        horizontal=True,
-        key=f"comedian_provider_{audio_key}",
-        help="OpenAI TTS — 6 voices. Sarvam AI — 30+ Indian-language voices (bulbul:v3).",
-    )
+        language = st.session_state.get(language_key, "English")
 
-    if provider == "Sarvam AI":
-        from backend.sarvam_audio_generator import SPEAKERS, LANGUAGE_CODES
-        has_key = bool(os.environ.get("SARVAM_API_KEY"))
-        voice_options = sorted(
-            f"{name.title()} ({'♂' if g == 'M' else '♀'})" for name, g in SPEAKERS.items()
-        )
-        comedian_choice = st.selectbox(
-            "Comedian Voice",
-            voice_options,
-            key=f"comedian_voice_{audio_key}",
-            help="This single voice performs every word of the play.",
-        )
-        comedian_voice = comedian_choice.split(" (")[0].lower()
-        lang_code = LANGUAGE_CODES.get(language, "en-IN")
-        st.caption(f"Language: **{language}** → `{lang_code}`")
-        if not has_key:
-            st.warning("SARVAM_API_KEY not set in .env — Sarvam TTS is disabled.")
-    else:
-        has_key = bool(os.environ.get("OPENAI_API_KEY"))
-        comedian_voice = st.selectbox(
-            "Comedian Voice",
-            _OPENAI_COMEDIAN_VOICES,
-            index=_OPENAI_COMEDIAN_VOICES.index("onyx"),
-            key=f"comedian_voice_{audio_key}",
-            help="This single voice performs every word of the play.",
-        )
-        if not has_key:
-            st.warning("OPENAI_API_KEY not set in .env — OpenAI TTS is disabled.")
-
-    # Show previously generated audio
-    if st.session_state.get(audio_key) and st.session_state.get(voice_map_key):
-        cached_voice = st.session_state[voice_map_key].get("COMEDIAN", comedian_voice)
-        st.markdown(f"**Performed by:** {cached_voice}")
-        st.audio(st.session_state[audio_key], format="audio/wav")
-        st.download_button(
-            label="⬇️ Download Audio (WAV)",
-            data=st.session_state[audio_key],
-            file_name="comedian_audio.wav",
-            mime="audio/wav",
-            key=f"dl_{audio_key}",
+        provider = st.radio(
+            "TTS Provider",
+            ["OpenAI TTS", "Sarvam AI"],
+            horizontal=True,
+            key=f"comedian_provider_{audio_key}",
+            help="OpenAI TTS — 6 voices. Sarvam AI — 30+ Indian-language voices (bulbul:v3).",
         )
-        st.markdown("---")
 
-    generate_btn = st.button(
-        "🎤 Generate Comedian Audio",
-        type="primary",
-        disabled=not has_key,
-        key=f"gen_comedian_{audio_key}",
-    )
+        if provider == "Sarvam AI":
+            b = _backends()
+            has_key = bool(os.environ.get("SARVAM_API_KEY"))
+            voice_options, name_by_label = _sarvam_voice_options()
+            comedian_choice = st.selectbox(
+                "Comedian Voice",
+                voice_options,
+                key=f"comedian_voice_{audio_key}",
+                help="This single voice performs every word of the play.",
+            )
+            comedian_voice = name_by_label[comedian_choice]
+            lang_code = b.LANGUAGE_CODES.get(language, "en-IN")
+            st.caption(f"Language: **{language}** → `{lang_code}`")
+            if not has_key:
+                st.warning("SARVAM_API_KEY not set in .env — Sarvam TTS is disabled.")
+        else:
+            has_key = bool(os.environ.get("OPENAI_API_KEY"))
+            comedian_voice = st.selectbox(
+                "Comedian Voice",
+                _OPENAI_COMEDIAN_VOICES,
+                index=_OPENAI_COMEDIAN_DEFAULT_INDEX,
+                key=f"comedian_voice_{audio_key}",
+                help="This single voice performs every word of the play.",
+            )
+            if not has_key:
+                st.warning("OPENAI_API_KEY not set in .env — OpenAI TTS is disabled.")
+
+        # Show previously generated audio
+        if st.session_state.get(audio_key) and st.session_state.get(voice_map_key):
+            cached_voice = st.session_state[voice_map_key].get("COMEDIAN", comedian_voice)
+            st.markdown(f"**Performed by:** {cached_voice}")
+            _render_audio_and_download(audio_key, "comedian_audio.wav", audio_key)
+            st.markdown("---")
+
+        generate_btn = st.button(
+            "🎤 Generate Comedian Audio",
+            type="primary",
+            disabled=not has_key,
+            key=f"gen_comedian_{audio_key}",
+        )
 
-    if generate_btn and has_key:
-        from backend.script_parser import parse_script, build_comedian_script
-        from backend.funny_play_generator import rewrite_as_comedian_monologue
+        if generate_btn and has_key:
+            b = _backends()
 
-        # Step 1: flatten the script (strips character names, drops headings)
-        segments = parse_script(st.session_state[script_key])
-        flat_text = build_comedian_script(segments)
+            # Step 1: flatten the script (strips character names, drops headings)
+            flat_text = _cached_build_comedian_script(st.session_state[script_key])
 
-        if not flat_text.strip():
-            st.error("Could not extract any text from the script.")
-            return
+            if not flat_text.strip():
+                st.error("Could not extract any text from the script.")
+                return
 
-        # Step 2: Claude rewrites it as a natural spoken monologue
-        rewrite_status = st.empty()
-        rewrite_status.info("Adapting script for comedian delivery…")
-        try:
-            comedian_text = rewrite_as_comedian_monologue(st.session_state[script_key], language=language)
-        except Exception as exc:
+            # Step 2: Claude rewrites it as a natural spoken monologue
+            rewrite_status = st.empty()
+            rewrite_status.info("Adapting script for comedian delivery…")
+            try:
+                comedian_text = b.rewrite_as_comedian_monologue(st.session_state[script_key], language=language)
+            except Exception as exc:
+                rewrite_status.empty()
+                st.error(f"Script adaptation failed: {exc}")
+                return
             rewrite_status.empty()
-            st.error(f"Script adaptation failed: {exc}")
-            return
-        rewrite_status.empty()
 
-        audio_progress = st.progress(0, text="Preparing comedian audio…")
-        audio_status = st.empty()
-        wav_bytes = None
-        voice_map = {}
+            # One lazily-created st.status widget; fast (cache-served)
+            # generations never flash it.
+            started = time.monotonic()
+            status = None
+            wav_bytes = None
+            voice_map = {}
+            last_pct = -1
+
+            if provider == "Sarvam AI":
+                gen = b.generate_comedian_audio_sarvam(comedian_text, comedian_voice, language)
+            else:
+                gen = b.generate_comedian_audio_openai(comedian_text, comedian_voice)
+
+            for event in gen:
+                if event["type"] == "audio_progress":
+                    cur, total = event["current"], event["total"]
+                    pct = cur * 100 // total  # int-only; avoids float divide per event
+                    # Only push to the browser when the percent bucket advances —
+                    # per-chunk updates at the same percent are no-op DOM messages.
+                    if (total > 1 or time.monotonic() - started > 0.3) and pct != last_pct:
+                        last_pct = pct
+                        if status is None:
+                            status = st.status("Generating comedian audio…", expanded=False)
+                        status.update(
+                            label=f"Synthesising… ({cur}/{total}) — {pct}%",
+                            state="running",
+                        )
+                elif event["type"] == "audio_done":
+                    wav_bytes = event["wav_bytes"]
+                    voice_map = event["voice_map"]
+                elif event["type"] == "audio_error":
+                    if status is not None:
+                        status.update(label="Audio generation failed", state="error")
+                    st.error(event["text"])
+                    return
 
-        if provider == "Sarvam AI":
-            from backend.sarvam_audio_generator import generate_comedian_audio
-            gen = generate_comedian_audio(comedian_text, comedian_voice, language)
-        else:
-            from backend.audio_generator import generate_comedian_audio
-            gen = generate_comedian_audio(comedian_text, comedian_voice)
-
-        for event in gen:
-            if event["type"] == "audio_progress":
-                cur, total = event["current"], event["total"]
-                audio_progress.progress(
-                    int(cur / total * 100),
-                    text=f"Synthesising… ({cur}/{total})",
-                )
-                audio_status.info("Generating comedian audio…")
-            elif event["type"] == "audio_done":
-                wav_bytes = event["wav_bytes"]
-                voice_map = event["voice_map"]
-            elif event["type"] == "audio_error":
-                st.error(event["text"])
-                return
+            if wav_bytes:
+                if status is not None:
+                    status.update(label="Audio ready!", state="complete")
+                st.success(f"Performance by **{comedian_voice}** is ready!")
+                st.session_state[audio_key] = wav_bytes
+                st.session_state[f"{audio_key}_buf"] = io.BytesIO(wav_bytes)
+                st.session_state[voice_map_key] = voice_map
 
-        if wav_bytes:
-            audio_progress.progress(100, text="Audio ready!")
-            audio_status.success(f"Performance by **{comedian_voice}** is ready!")
-            st.session_state[audio_key] = wav_bytes
-            st.session_state[voice_map_key] = voice_map
-
-            st.markdown(f"**Performed by:** {comedian_voice}")
-            st.audio(wav_bytes, format="audio/wav")
-            st.download_button(
-                label="⬇️ Download Audio (WAV)",
-                data=wav_bytes,
-                file_name="comedian_audio.wav",
-                mime="audio/wav",
-                key=f"dl_new_{audio_key}",
-            )
+                st.markdown(f"**Performed by:** {comedian_voice}")
+                _render_audio_and_download(audio_key, "comedian_audio.wav", f"new_{audio_key}")
+
+
+@st.cache_data(max_entries=16)
+def _voice_map_df(voice_map: dict, narrator_label: str) -> pd.DataFrame:
+    """
+    Two-column DataFrame of character → voice assignments.
+
+    st.table re-infers dtypes from a list of dicts on every call; converting
+    once and caching on the (map, label) pair makes repeat renders of the
+    same assignment free.
+    """
+    rows = [{"Character": k, "Voice": v} for k, v in voice_map.items()]
+    rows.append({"Character": "NARRATOR", "Voice": narrator_label})
+    return pd.DataFrame(rows)
 
 
 def _show_voice_map(voice_map: dict, narrator_label: str) -> None:
     """Render a table of character → voice assignments."""
     st.markdown("**Voice assignments:**")
-    rows = [{"Character": k, "Voice": v} for k, v in voice_map.items()]
-    rows.append({"Character": "NARRATOR", "Voice": narrator_label})
-    st.table(rows)
+    st.table(_voice_map_df(voice_map, narrator_label))
 
 
-def _run_audio_generation(
-    script_key: str,
-    audio_key: str,
-    voice_map_key: str,
+@st.cache_data(persist="disk", max_entries=64, show_spinner=False)
+def _synthesize_play(
+    script_text: str,
     provider: str,
     language: str,
     narrator_voice: str,
-) -> None:
-    """Run the TTS pipeline and update session state."""
-    from backend.script_parser import parse_script
-
-    segments = parse_script(st.session_state[script_key])
+    _progress_cb=None,
+) -> tuple:
+    """
+    Full TTS pipeline (parse → synthesise → stitch), persisted to disk.
+
+    Keyed on (script, provider, language, narrator voice), so regenerating
+    the same script — even after a browser refresh wipes session_state —
+    serves the finished (wav_bytes, voice_map) pair from Streamlit's disk
+    cache.  The underscore-prefixed progress callback is excluded from the
+    cache key; on a hit it is simply never invoked.  Pipeline failures raise
+    instead of yielding an event, so errors are never cached.
+    """
+    b = _backends()
+    segments = _cached_parse_script(script_text)
     if not segments:
-        st.error("Could not parse any segments from the script.")
-        return
-
-    audio_progress = st.progress(0, text="Preparing audio…")
-    audio_status = st.empty()
+        raise ValueError("Could not parse any segments from the script.")
 
     if provider == "Sarvam AI":
-        from backend.sarvam_audio_generator import SarvamAudioGenerator
-        generator = SarvamAudioGenerator(language=language, narrator_voice=narrator_voice)
+        generator = b.SarvamAudioGenerator(language=language, narrator_voice=narrator_voice)
     else:
-        from backend.audio_generator import AudioGenerator
-        generator = AudioGenerator()
+        generator = b.AudioGenerator()
 
     wav_bytes = None
     voice_map = {}
-
     for event in generator.generate_audio_play(segments):
         if event["type"] == "audio_progress":
-            cur, total, speaker = event["current"], event["total"], event["speaker"]
-            audio_progress.progress(
-                int(cur / total * 100),
-                text=f"Synthesising {speaker} ({cur}/{total})…",
-            )
-            audio_status.info(f"Processing segment {cur} of {total}: **{speaker}**")
+            if _progress_cb is not None:
+                _progress_cb(event)
         elif event["type"] == "audio_done":
             wav_bytes = event["wav_bytes"]
             voice_map = event["voice_map"]
         elif event["type"] == "audio_error":
-            st.error(event["text"])
-            return
+            raise RuntimeError(event["text"])
+    return wav_bytes, voice_map
+
+
+def _run_audio_generation(
+    script_key: str,
+    audio_key: str,
+    voice_map_key: str,
+    provider: str,
+    language: str,
+    narrator_voice: str,
+) -> None:
+    """Run the (disk-cached) TTS pipeline and update session state."""
+    # One st.status widget instead of a progress bar + status slot — a single
+    # DOM element receiving one update per state change.  The widget MUST be
+    # created here, before the cached call: any element created while
+    # _synthesize_play executes gets recorded by st.cache_data's element
+    # replay, and every later cache hit would re-render a stale copy of it
+    # stuck in the "running" state.  The callback below only updates this
+    # pre-existing widget, which is not replayed.
+    status = st.status("Preparing audio…", expanded=False)
+    last_pct = -1
+    last_speaker = None
+
+    def _on_progress(event: dict) -> None:
+        nonlocal last_pct, last_speaker
+        cur, total, speaker = event["current"], event["total"], event["speaker"]
+        pct = cur * 100 // total  # int-only; avoids float divide per event
+        # Only push widget updates when something visible changed; events
+        # at the same percent/speaker are no-op DOM messages otherwise.
+        if pct != last_pct or speaker != last_speaker:
+            last_pct = pct
+            last_speaker = speaker
+            status.update(
+                label=f"Synthesising {speaker} ({cur}/{total}) — {pct}%",
+                state="running",
+            )
+
+    try:
+        wav_bytes, voice_map = _synthesize_play(
+            st.session_state[script_key], provider, language, narrator_voice,
+            _progress_cb=_on_progress,
+        )
+    except (ValueError, RuntimeError) as exc:
+        status.update(label="Audio generation failed", state="error")
+        st.error(str(exc))
+        return
 
     if wav_bytes:
-        audio_progress.progress(100, text="Audio ready!")
-        audio_status.success("Audio play generated!")
+        status.update(label="Audio play generated!", state="complete")
         st.session_state[audio_key] = wav_bytes
+        st.session_state[f"{audio_key}_buf"] = io.BytesIO(wav_bytes)
         st.session_state[voice_map_key] = voice_map
         st.session_state[f"{audio_key}_narrator_label"] = narrator_voice
 
 
+@st.fragment
 def render_audio_section(
     script_key: str,
     audio_key: str,
@@ -259,118 +513,102 @@ def render_audio_section(
     audio_key     : session_state key for cached WAV bytes
     voice_map_key : session_state key for the character→voice dict
     language_key  : session_state key for the play language string
+
+    Runs as a fragment: provider/voice widget changes rerun only this section,
+    not the whole script (all cross-rerun state lives in st.session_state).
     """
     st.divider()
-    st.subheader("🎙️ Audio Play")
-
-    language = st.session_state.get(language_key, "English")
-
-    # ── Provider selector ─────────────────────────────────────────────────────
-    provider = st.radio(
-        "TTS Provider",
-        ["OpenAI TTS", "Sarvam AI"],
-        horizontal=True,
-        key=f"provider_{audio_key}",
-        help="OpenAI TTS uses English-focused voices. Sarvam AI (bulbul:v3) has 30+ voices optimised for Indian languages.",
-    )
-
-    # ── Provider-specific config ──────────────────────────────────────────────
-    narrator_voice: str
-    has_key: bool
+    # Collapsed by default: the player, table, and download widgets inside
+    # are only built once the user opens the panel.
+    with st.expander("🎙️ Audio Play", expanded=False):
+
+        language = st.session_state.get(language_key, "English")
+
+        # ── Provider selector ─────────────────────────────────────────────────────
+        provider = st.radio(
+            "TTS Provider",
+            ["OpenAI TTS", "Sarvam AI"],
+            horizontal=True,
+            key=f"provider_{audio_key}",
+            help="OpenAI TTS uses English-focused voices. Sarvam AI (bulbul:v3) has 30+ voices optimised for Indian languages.",
+        )
 
-    if provider == "Sarvam AI":
-        from backend.sarvam_audio_generator import SPEAKERS, NARRATOR_DEFAULT, LANGUAGE_CODES
+        # ── Provider-specific config ──────────────────────────────────────────────
+        narrator_voice: str
+        has_key: bool
 
-        openai_key = os.environ.get("SARVAM_API_KEY")
-        has_key = bool(openai_key)
+        if provider == "Sarvam AI":
+            b = _backends()
 
-        # Build labelled option list: "Kabir (♂)", "Priya (♀)", …
-        voice_options = sorted(
-            f"{name.title()} ({'♂' if g == 'M' else '♀'})" for name, g in SPEAKERS.items()
-        )
-        default_gender = SPEAKERS.get(NARRATOR_DEFAULT, "M")
-        default_label = f"{NARRATOR_DEFAULT.title()} ({'♂' if default_gender == 'M' else '♀'})"
-        default_idx = next(
-            (i for i, v in enumerate(voice_options) if v == default_label), 0
-        )
+            openai_key = os.environ.get("SARVAM_API_KEY")
+            has_key = bool(openai_key)
 
-        narrator_choice = st.selectbox(
-            "Narrator Voice",
-            voice_options,
-            index=default_idx,
-            key=f"sarvam_narrator_{audio_key}",
-            help="Used for all stage directions and scene headings. Characters are auto-assigned alternating male/female voices.",
-        )
-        narrator_voice = narrator_choice.split(" (")[0].lower()
+            voice_options, name_by_label = _sarvam_voice_options()
+            _, default_idx = _sarvam_narrator_default()
 
-        lang_code = LANGUAGE_CODES.get(language, "en-IN")
-        st.caption(
-            f"Language: **{language}** → `{lang_code}`  |  "
-            "Characters auto-assigned alternating ♂/♀ voices from bulbul:v3."
-        )
+            narrator_choice = st.selectbox(
+                "Narrator Voice",
+                voice_options,
+                index=default_idx,
+                key=f"sarvam_narrator_{audio_key}",
+                help="Used for all stage directions and scene headings. Characters are auto-assigned alternating male/female voices.",
+            )
+            narrator_voice = name_by_label[narrator_choice]
 
-        if not has_key:
-            st.warning("SARVAM_API_KEY not set in .env — Sarvam TTS is disabled.")
+            lang_code = b.LANGUAGE_CODES.get(language, "en-IN")
+            st.caption(
+                f"Language: **{language}** → `{lang_code}`  |  "
+                "Characters auto-assigned alternating ♂/♀ voices from bulbul:v3."
+            )
 
-    else:  # OpenAI TTS
-        openai_key = os.environ.get("OPENAI_API_KEY")
-        has_key = bool(openai_key)
-        narrator_voice = "fable"
-        st.caption(
-            "Narrator uses **fable**. Characters are auto-assigned from: "
-            "alloy, echo, onyx, nova, shimmer."
-        )
-        if not has_key:
-            st.warning("OPENAI_API_KEY not set in .env — OpenAI TTS is disabled.")
-
-    # ── Show previously generated audio (same tab session) ───────────────────
-    if st.session_state.get(audio_key) and st.session_state.get(voice_map_key):
-        st.markdown("---")
-        _show_voice_map(
-            st.session_state[voice_map_key],
-            narrator_label=st.session_state.get(f"{audio_key}_narrator_label", narrator_voice),
-        )
-        st.audio(st.session_state[audio_key], format="audio/wav")
-        st.download_button(
-            label="⬇️ Download Audio (WAV)",
-            data=st.session_state[audio_key],
-            file_name="play_audio.wav",
-            mime="audio/wav",
-            key=f"dl_{audio_key}",
-        )
-        st.markdown("---")
+            if not has_key:
+                st.warning("SARVAM_API_KEY not set in .env — Sarvam TTS is disabled.")
 
-    # ── Generate button ───────────────────────────────────────────────────────
-    generate_btn = st.button(
-        "🎙️ Generate Audio Play",
-        type="primary",
-        disabled=not has_key,
-        key=f"gen_audio_{audio_key}",
-    )
+        else:  # OpenAI TTS
+            openai_key = os.environ.get("OPENAI_API_KEY")
+            has_key = bool(openai_key)
+            narrator_voice = "fable"
+            st.caption(
+                "Narrator uses **fable**. Characters are auto-assigned from: "
+                "alloy, echo, onyx, nova, shimmer."
+            )
+            if not has_key:
+                st.warning("OPENAI_API_KEY not set in .env — OpenAI TTS is disabled.")
 
-    if generate_btn and has_key:
-        _run_audio_generation(
-            script_key=script_key,
-            audio_key=audio_key,
-            voice_map_key=voice_map_key,
-            provider=provider,
-            language=language,
-            narrator_voice=narrator_voice,
-        )
-        # Show freshly generated audio
-        if st.session_state.get(audio_key):
+        # ── Show previously generated audio (same tab session) ───────────────────
+        if st.session_state.get(audio_key) and st.session_state.get(voice_map_key):
+            st.markdown("---")
             _show_voice_map(
                 st.session_state[voice_map_key],
                 narrator_label=st.session_state.get(f"{audio_key}_narrator_label", narrator_voice),
             )
-            st.audio(st.session_state[audio_key], format="audio/wav")
-            st.download_button(
-                label="⬇️ Download Audio (WAV)",
-                data=st.session_state[audio_key],
-                file_name="play_audio.wav",
-                mime="audio/wav",
-                key=f"dl_new_{audio_key}",
+            _render_audio_and_download(audio_key, "play_audio.wav", audio_key)
+            st.markdown("---")
+
+        # ── Generate button ───────────────────────────────────────────────────────
+        generate_btn = st.button(
+            "🎙️ Generate Audio Play",
+            type="primary",
+            disabled=not has_key,
+            key=f"gen_audio_{audio_key}",
+        )
+
+        if generate_btn and has_key:
+            _run_audio_generation(
+                script_key=script_key,
+                audio_key=audio_key,
+                voice_map_key=voice_map_key,
+                provider=provider,
+                language=language,
+                narrator_voice=narrator_voice,
             )
+            # Show freshly generated audio
+            if st.session_state.get(audio_key):
+                _show_voice_map(
+                    st.session_state[voice_map_key],
+                    narrator_label=st.session_state.get(f"{audio_key}_narrator_label", narrator_voice),
+                )
+                _render_audio_and_download(audio_key, "play_audio.wav", f"new_{audio_key}")
 
 
 # ── Tabs ──────────────────────────────────────────────────────────────────────
@@ -382,50 +620,77 @@ tab_collab, tab_funny = st.tabs(["🤝 AI Collaboration Play", "😂 One-Act Fun
 # TAB 1 — AI Collaboration
 # ══════════════════════════════════════════════════════════════════════════════
 
+@st.fragment
+def _collab_sidebar() -> None:
+    """
+    Sidebar controls for the collaboration tab.
+
+    Runs as a fragment so tweaking a genre/tone/rounds widget no longer
+    reruns the whole script (and with it the funny-play tab and both audio
+    panels).  All inputs live in session_state; the start button sets a flag
+    and escalates to a full-app rerun, which is what actually kicks off
+    generation.
+    """
+    st.header("🤝 Collaboration Play")
+
+    st.selectbox(
+        "Genre",
+        ["Comedy", "Drama", "Thriller", "Romance", "Sci-Fi", "Fantasy", "Mystery"],
+        index=0,
+        key="collab_genre",
+    )
+    st.text_area(
+        "Theme / Premise",
+        value="A sentient coffee machine falls in love with a barista who wants to quit their job",
+        height=100,
+        key="theme_collab",
+    )
+    st.selectbox(
+        "Tone",
+        ["Satirical and absurd", "Heartfelt and sincere", "Dark and suspenseful",
+         "Light and whimsical", "Bittersweet"],
+        index=0,
+        key="collab_tone",
+    )
+    st.slider(
+        "Discussion Rounds",
+        min_value=2, max_value=8, value=5,
+        key="collab_rounds",
+        help="How many back-and-forth rounds the agents have.",
+    )
+    st.selectbox(
+        "Language",
+        ["English", "Hindi (हिंदी)", "Bengali (বাংলা)"],
+        index=0,
+        key="language_collab",
+        help="All dialogue, directions, and headings will be written in this language.",
+    )
+    st.divider()
+    if st.button("✍️ Write the Play!", type="primary", use_container_width=True):
+        st.session_state["collab_start"] = True
+        st.rerun(scope="app")
+
+
 with tab_collab:
     with st.sidebar:
-        st.header("🤝 Collaboration Play")
-
-        genre = st.selectbox(
-            "Genre",
-            ["Comedy", "Drama", "Thriller", "Romance", "Sci-Fi", "Fantasy", "Mystery"],
-            index=0,
-        )
-        theme_collab = st.text_area(
-            "Theme / Premise",
-            value="A sentient coffee machine falls in love with a barista who wants to quit their job",
-            height=100,
-            key="theme_collab",
-        )
-        tone = st.selectbox(
-            "Tone",
-            ["Satirical and absurd", "Heartfelt and sincere", "Dark and suspenseful",
-             "Light and whimsical", "Bittersweet"],
-            index=0,
-        )
-        max_rounds = st.slider(
-            "Discussion Rounds",
-            min_value=2, max_value=8, value=5,
-            help="How many back-and-forth rounds the agents have.",
-        )
-        language_collab = st.selectbox(
-            "Language",
-            ["English", "Hindi (हिंदी)", "Bengali (বাংলা)"],
-            index=0,
-            key="language_collab",
-            help="All dialogue, directions, and headings will be written in this language.",
-        )
-        st.divider()
-        start_btn = st.button("✍️ Write the Play!", type="primary", use_container_width=True)
+        _collab_sidebar()
 
     # ── Main ──────────────────────────────────────────────────────────────────
+    start_btn = st.session_state.pop("collab_start", False)
     if start_btn:
+        genre = st.session_state["collab_genre"]
+        theme_collab = st.session_state["theme_collab"]
+        tone = st.session_state["collab_tone"]
+        max_rounds = st.session_state["collab_rounds"]
+        language_collab = st.session_state["language_collab"]
+
         if not os.environ.get("ANTHROPIC_API_KEY"):
             st.error("ANTHROPIC_API_KEY not found. Please set it in your .env file.")
             st.stop()
 
         st.session_state["collab_script"] = None
         st.session_state["collab_audio"] = None
+        st.session_state["collab_audio_buf"] = None
         st.session_state["collab_voice_map"] = None
 
         progress_bar = st.progress(0, text="Starting discussion…")
@@ -435,8 +700,7 @@ with tab_collab:
         st.divider()
         final_area = st.container()
 
-        from backend.agents import PlayWritingSession
-        session = PlayWritingSession(
+        session = _backends().PlayWritingSession(
             genre=genre, theme=theme_collab, tone=tone,
             max_rounds=max_rounds, language=language_collab,
         )
@@ -444,6 +708,8 @@ with tab_collab:
         current_round = 0
         writer_buf = ""
         director_buf = ""
+        writer_gate = _FlushGate()
+        director_gate = _FlushGate()
         in_final = False
         round_containers: dict = {}
         final_script_box = None
@@ -468,7 +734,7 @@ with tab_collab:
                 current_round = event["round"]
                 writer_buf = director_buf = ""
                 progress_bar.progress(
-                    int((current_round - 1) / max_rounds * 100),
+                    (current_round - 1) * 100 // max_rounds,
                     text=f"Round {current_round} / {max_rounds}",
                 )
                 status_text.info(f"Round {current_round}: Story Writer is drafting…")
@@ -478,7 +744,8 @@ with tab_collab:
 
             elif etype == "writer_chunk":
                 writer_buf += event["text"]
-                get_round_container(current_round)["writer_box"].markdown(writer_buf + "▌")
+                if writer_gate.ready(len(event["text"])):
+                    get_round_container(current_round)["writer_box"].markdown(writer_buf + "▌")
 
             elif etype == "writer_done":
                 get_round_container(current_round)["writer_box"].markdown(writer_buf)
@@ -486,15 +753,16 @@ with tab_collab:
 
             elif etype == "director_chunk":
                 director_buf += event["text"]
-                if not in_final:
-                    get_round_container(current_round)["director_box"].markdown(director_buf + "▌")
-                else:
-                    final_script_box.markdown(director_buf + "▌")
+                if director_gate.ready(len(event["text"])):
+                    if not in_final:
+                        get_round_container(current_round)["director_box"].markdown(director_buf + "▌")
+                    else:
+                        final_script_box.markdown(director_buf + "▌")
 
             elif etype == "director_done":
                 get_round_container(current_round)["director_box"].markdown(director_buf)
                 progress_bar.progress(
-                    int(current_round / max_rounds * 100),
+                    current_round * 100 // max_rounds,
                     text=f"Completed round {current_round}",
                 )
 
@@ -506,14 +774,14 @@ with tab_collab:
                     st.subheader("🎭 Final Play Script")
                     final_script_box = st.empty()
                     final_script_box.markdown(event["text"])
-                session.save_script("play_script.txt")
-                st.success("Script saved to **play_script.txt**")
+                save_future = _save_script_async(session.save_script, "play_script.txt")
                 st.download_button(
                     label="⬇️ Download Script",
                     data=event["text"],
                     file_name="play_script.txt",
                     mime="text/plain",
                 )
+                _report_save(save_future, "play_script.txt")
                 st.session_state["collab_script"] = event["text"]
                 st.session_state["collab_language"] = language_collab
                 st.session_state["collab_audio"] = None
@@ -594,6 +862,7 @@ think David Attenborough, but the wildlife are people making terrible choices.
     if funny_btn:
         st.session_state["funny_script"] = None
         st.session_state["funny_audio"] = None
+        st.session_state["funny_audio_buf"] = None
         st.session_state["funny_voice_map"] = None
 
         st.divider()
@@ -604,21 +873,21 @@ think David Attenborough, but the wildlife are people making terrible choices.
             funny_status.info("The comedy agent is writing your play…")
             script_box = st.empty()
             script_buf = ""
+            script_gate = _FlushGate()
 
-            from backend.funny_play_generator import FunnyPlayGenerator
-            gen = FunnyPlayGenerator(theme=funny_theme, language=language_funny)
+            gen = _backends().FunnyPlayGenerator(theme=funny_theme, language=language_funny)
 
             for event in gen.run_streaming():
                 if event["type"] == "chunk":
                     script_buf += event["text"]
-                    script_box.markdown(script_buf + "▌")
+                    if script_gate.ready(len(event["text"])):
+                        script_box.markdown(script_buf + "▌")
                 elif event["type"] == "warning":
                     st.warning(event["text"])
                 elif event["type"] == "done":
                     script_box.markdown(script_buf)
                     funny_status.success("Your funny play is ready!")
-                    gen.save_script("funny_play.txt")
-                    st.success("Script saved to **funny_play.txt**")
+                    save_future = _save_script_async(gen.save_script, "funny_play.txt")
                     st.download_button(
                         label="⬇️ Download Script",
                         data=script_buf,
@@ -626,6 +895,7 @@ think David Attenborough, but the wildlife are people making terrible choices.
                         mime="text/plain",
                         key="funny_dl_script",
                     )
+                    _report_save(save_future, "funny_play.txt")
                     st.session_state["funny_script"] = script_buf
                     st.session_state["funny_language"] = language_funny
                     st.session_state["funny_audio"] = None
@@ -643,13 +913,16 @@ think David Attenborough, but the wildlife are people making terrible choices.
 
             script_box = initial_script_area.empty()
             script_buf = ""
+            script_gate = _FlushGate()
+            director_gate = _FlushGate()
+            revision_gate = _FlushGate()
             director_boxes: dict = {}
             director_bufs: dict = {}
+            current_critique_round = None
             revision_box = None
             revision_buf = ""
 
-            from backend.funny_play_generator import FunnyPlayDirectorLoop
-            gen = FunnyPlayDirectorLoop(
+            gen = _backends().FunnyPlayDirectorLoop(
                 theme=funny_theme,
                 language=language_funny,
                 critique_rounds=critique_rounds,
@@ -660,7 +933,8 @@ think David Attenborough, but the wildlife are people making terrible choices.
 
                 if etype == "chunk":
                     script_buf += event["text"]
-                    script_box.markdown(script_buf + "▌")
+                    if script_gate.ready(len(event["text"])):
+                        script_box.markdown(script_buf + "▌")
 
                 elif etype == "initial_done":
                     script_box.markdown(script_buf)
@@ -668,6 +942,7 @@ think David Attenborough, but the wildlife are people making terrible choices.
 
                 elif etype == "director_start":
                     n, total = event["round"], event["total"]
+                    current_critique_round = n
                     with critique_area:
                         exp = st.expander(
                             f"🎬 Director Critique — Round {n} of {total}",
@@ -677,9 +952,12 @@ think David Attenborough, but the wildlife are people making terrible choices.
                     director_bufs[n] = ""
 
                 elif etype == "director_chunk":
-                    n = max(director_boxes.keys())
+                    # Chunks always target the round opened by the most recent
+                    # director_start — no need to max() over the dict per chunk.
+                    n = current_critique_round
                     director_bufs[n] += event["text"]
-                    director_boxes[n].markdown(director_bufs[n] + "▌")
+                    if director_gate.ready(len(event["text"])):
+                        director_boxes[n].markdown(director_bufs[n] + "▌")
 
                 elif etype == "director_done":
                     n = event["round"]
@@ -692,7 +970,7 @@ think David Attenborough, but the wildlife are people making terrible choices.
 
                 elif etype == "revision_chunk":
                     revision_buf += event["text"]
-                    if revision_box is not None:
+                    if revision_box is not None and revision_gate.ready(len(event["text"])):
                         revision_box.markdown(revision_buf + "▌")
 
                 elif etype == "revision_done":
@@ -703,8 +981,7 @@ think David Attenborough, but the wildlife are people making terrible choices.
 
                 elif etype == "final_done":
                     funny_status.success("🎭 Final play ready!")
-                    gen.save_script("funny_play.txt")
-                    st.success("Script saved to **funny_play.txt**")
+                    save_future = _save_script_async(gen.save_script, "funny_play.txt")
                     st.download_button(
                         label="⬇️ Download Script",
                         data=event["text"],
@@ -712,6 +989,7 @@ think David Attenborough, but the wildlife are people making terrible choices.
                         mime="text/plain",
                         key="funny_dl_script",
                     )
+                    _report_save(save_future, "funny_play.txt")
                     st.session_state["funny_script"] = event["text"]
                     st.session_state["funny_language"] = language_funny
                     st.session_state["funny_audio"] = None
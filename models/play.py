@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from typing import List
 
 
-@dataclass
+@dataclass(slots=True)
 class Round:
     """
     Represents one exchange in the agent discussion.
@@ -22,7 +22,7 @@ class Round:
     director_note: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaySession:
     """
     Holds the full state of a single play-writing session.
@@ -41,16 +41,16 @@ class PlaySession:
     rounds: List[Round] = field(default_factory=list)
     final_script: str = ""
 
+    # One precompiled template for summary(): a single %-format pass instead
+    # of four f-strings, a list, and a join per call.
+    _SUMMARY_TMPL = "Genre : %s\nTheme : %s\nTone  : %s\nRounds: %d / %d"
+
     def add_round(self, round_number: int, writer_draft: str, director_note: str) -> None:
         """Append a completed exchange to the session history."""
         self.rounds.append(Round(round_number, writer_draft, director_note))
 
     def summary(self) -> str:
         """Return a brief plain-text summary of the session."""
-        lines = [
-            f"Genre : {self.genre}",
-            f"Theme : {self.theme}",
-            f"Tone  : {self.tone}",
-            f"Rounds: {len(self.rounds)} / {self.max_rounds}",
-        ]
-        return "\n".join(lines)
+        return self._SUMMARY_TMPL % (
+            self.genre, self.theme, self.tone, len(self.rounds), self.max_rounds
+        )
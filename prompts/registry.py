@@ -6,7 +6,11 @@ to retrieve a prompt by its key.  Adding a new agent means adding one entry
 to PROMPTS — no changes needed anywhere else.
 """
 
-from typing import Dict
+import string
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Tuple, Union
 
 
 # ── Prompt definitions ────────────────────────────────────────────────────────
@@ -30,6 +34,10 @@ Your responsibilities in this collaboration:
 Format your contributions with clear scene structure:
   ACT / SCENE headings, CHARACTER NAME: dialogue, and (stage directions).
 
+In every revision round: revise and expand the script, incorporating the
+Director's best suggestions. Be creative and specific — write actual
+dialogue and stage directions, never summaries of what you would write.
+
 Be bold. Be specific. Make it fun.""",
 
     # ------------------------------------------------------------------
@@ -49,6 +57,10 @@ Your responsibilities in this collaboration:
 - In the FINAL round, synthesise all the best ideas into one polished,
   complete, performance-ready play script.
 
+Each round you receive the Writer's latest draft as the preceding message.
+Give your directorial critique: what works brilliantly, what needs fixing,
+and concrete rewrite suggestions. Be specific and demanding.
+
 Be demanding but fair. Great theatre comes from honest collaboration.""",
 
     # ------------------------------------------------------------------
@@ -151,21 +163,19 @@ Give exactly 4–6 bullet-point critiques covering:
 End with one sentence beginning "MOST IMPORTANT FIX:" that names the single change that
 will lift this play the most. Be concrete — name the line or beat, not the general issue.""",
 
-    "funny_play_director_critique": """Read this micro-play script and give your harshest, most
-useful critique. Identify every weakness. Be specific — quote lines that fail.
-
-SCRIPT:
-{script}""",
+    # The script itself is sent as a separate (cacheable) content block ahead
+    # of these instructions — see funny_play_generator — so the templates
+    # reference it as "above" rather than embedding it.
+    "funny_play_director_critique": """Read the micro-play script above and give your harshest, most
+useful critique. Identify every weakness. Be specific — quote lines that fail.""",
 
-    "funny_play_revise": """A harsh comedy director has critiqued your micro-play. Study the notes
-carefully and rewrite the play to address every single point.
+    "funny_play_revise": """A harsh comedy director has critiqued your micro-play — the original
+script is above. Study the notes carefully and rewrite the play to address
+every single point.
 
 DIRECTOR'S CRITIQUE:
 {critique}
 
-ORIGINAL SCRIPT:
-{script}
-
 HARD CONSTRAINTS — these are non-negotiable, check before finishing:
 • LANGUAGE: Write EVERY word — title, cast, all stage directions, all dialogue — in {language}.
 • WORD LIMIT: 180–220 words TOTAL (title + cast + ALL directions + ALL dialogue). Count every word.
@@ -200,6 +210,110 @@ Write the entire play now. Do not truncate, skip, or abbreviate any section.""",
 }
 
 
+# The registry is fixed after import.  Interned keys let dict lookups hit
+# CPython's pointer-equality fast path (callers pass string literals, which
+# the compiler interns), and the read-only proxy documents — and enforces —
+# that nothing mutates the registry at runtime.
+PROMPTS = MappingProxyType({sys.intern(k): v for k, v in PROMPTS.items()})
+
+
+# ── Template compilation ──────────────────────────────────────────────────────
+#
+# str.format re-parses the whole template on every call — for the multi-KB
+# prompts above that means re-tokenising braces per retrieval.  Each template
+# is instead parsed exactly once at import into (literal, field) segments;
+# rendering is then a walk over the segments and one join, O(placeholders)
+# instead of O(len(template)).  Zero-field templates compile to the plain
+# string and skip rendering entirely.
+
+# A compiled entry is the literal prompt (no placeholders), a closure for
+# single-placeholder templates, or a tuple of (literal, field_name) segments
+# in template order for the general case.
+_Segments = Tuple[Tuple[str, str], ...]
+
+
+def _single_field_renderer(prefix: str, field: str, suffix: str):
+    """Specialised renderer for prefix + {field} + suffix templates.
+
+    Three-way concatenation is a straight copy — no segment walk, no
+    intermediate list, no join machinery.
+    """
+    def render(kwargs: dict) -> str:
+        return prefix + kwargs[field] + suffix
+    return render
+
+
+def _compile(template: str):
+    """Parse *template* once; return a str, closure, or segment tuple."""
+    segments = []
+    fields = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        # The registry only uses bare {name} placeholders.
+        if spec or conversion:
+            raise ValueError(f"unsupported format spec in prompt template: {template[:40]!r}")
+        if field is not None:
+            fields.append(field)
+        segments.append((literal, field))
+    if not fields:
+        return template
+    if len(fields) == 1:
+        # Exactly one placeholder: specialise to prefix + value + suffix.
+        prefix = segments[0][0]
+        suffix = segments[1][0] if len(segments) > 1 else ""
+        return _single_field_renderer(prefix, fields[0], suffix)
+    return tuple(segments)
+
+
+_COMPILED: Dict[str, Union[str, _Segments]] = {
+    name: _compile(template) for name, template in PROMPTS.items()
+}
+
+# Placeholder names each template needs, recorded once at compile time.
+_FIELDS: Dict[str, frozenset] = {
+    name: frozenset(
+        field for _, field, _, _ in string.Formatter().parse(template) if field
+    )
+    for name, template in PROMPTS.items()
+}
+
+# The registry is fixed after import; snapshot the key list once for error
+# messages instead of rebuilding it on every miss.
+_AVAILABLE: Tuple[str, ...] = tuple(PROMPTS)
+
+
+def _raise_unknown(name: str):
+    """Raise the lookup error for *name* — kept out of get() so the f-string
+    is only ever built on the miss path."""
+    raise KeyError(f"Prompt '{name}' not found in registry. "
+                   f"Available: {list(_AVAILABLE)}")
+
+
+@lru_cache(maxsize=256)
+def _render(name: str, kwargs_items: tuple) -> str:
+    """
+    Render a compiled template against frozen kwargs, memoised.
+
+    The same prompt/kwargs pairs recur every round of a session (the system
+    prompts with a fixed language above all), and each render rebuilds a
+    multi-KB string.  Keying on (name, sorted kwargs items) turns repeats
+    into a dict hit returning the exact same string object — which also
+    keeps prompts byte-identical for Anthropic's prompt cache.
+    """
+    compiled = _COMPILED[name]
+    if isinstance(compiled, str):
+        return compiled
+    kwargs = dict(kwargs_items)
+    if callable(compiled):
+        return compiled(kwargs)
+    parts = []
+    for literal, field in compiled:
+        if literal:
+            parts.append(literal)
+        if field is not None:
+            parts.append(kwargs[field])
+    return "".join(parts)
+
+
 # ── Registry class ────────────────────────────────────────────────────────────
 
 class PromptRegistry:
@@ -213,17 +327,59 @@ class PromptRegistry:
         Example:
             PromptRegistry.get("story_writer_opening", genre="Comedy", theme="AI", tone="Satirical")
         """
-        if name not in PROMPTS:
-            raise KeyError(f"Prompt '{name}' not found in registry. "
-                           f"Available: {list(PROMPTS.keys())}")
-        prompt = PROMPTS[name]
-        # Format only if kwargs are supplied — avoids KeyError on prompts
-        # that contain no placeholders.
-        if kwargs:
-            prompt = prompt.format(**kwargs)
-        return prompt
+        # Single probe: .get with a None check instead of `in` + `[]`,
+        # which hashed and looked the key up twice.
+        compiled = _COMPILED.get(name)
+        if compiled is None:
+            _raise_unknown(name)
+        if isinstance(compiled, str):
+            # Zero-field template: the compiled form is the prompt itself.
+            return compiled
+        # Keep only the fields this template actually uses: callers often
+        # pass a whole bundle (genre/theme/tone/language) to prompts needing
+        # one of them, and extras would both bloat the memo key and split
+        # otherwise-identical renders into separate cache entries.
+        required = _FIELDS[name]
+        if kwargs.keys() != required:
+            kwargs = {k: kwargs[k] for k in required}
+        return _render(name, tuple(sorted(kwargs.items())))
+
+    @staticmethod
+    def bind(**kwargs: str) -> "BoundPrompts":
+        """
+        Pre-render every prompt satisfiable from *kwargs* for a session.
+
+        A session's language/genre/theme/tone are fixed up front, so callers
+        that would otherwise call get() with the same kwargs every round can
+        bind once and read plain strings from the returned object — zero
+        format calls in the round loop.  Prompts needing fields not present
+        in *kwargs* (e.g. the per-round {critique}) are left out and must
+        still go through get().
+        """
+        rendered = {
+            name: PromptRegistry.get(name, **{k: kwargs[k] for k in _FIELDS[name]})
+            for name in _AVAILABLE
+            if _FIELDS[name] <= kwargs.keys()
+        }
+        return BoundPrompts(rendered)
 
     @staticmethod
     def list_prompts() -> list:
         """Return all registered prompt keys."""
         return list(PROMPTS.keys())
+
+
+class BoundPrompts:
+    """Read-only bundle of prompts pre-rendered by PromptRegistry.bind."""
+
+    __slots__ = ("_rendered",)
+
+    def __init__(self, rendered: Dict[str, str]):
+        self._rendered = rendered
+
+    def get(self, name: str) -> str:
+        """Return the pre-rendered prompt for *name* — a single dict probe."""
+        prompt = self._rendered.get(name)
+        if prompt is None:
+            _raise_unknown(name)
+        return prompt